@@ -93,6 +93,7 @@ class RetrievalClient:
         doi_resolver = DoiResolverService(
             crossref=crossref_client, datacite=datacite_client
         )
+        self._doi_resolver = doi_resolver
 
         semanticscholar_client = semanticscholar_client or SemanticScholarClient(
             session=self.session,
@@ -113,6 +114,7 @@ class RetrievalClient:
             datacite=datacite_client,
             doi_resolver=doi_resolver,
             merge_service=merge_service,
+            search_cache_ttl=self.settings.search_cache_ttl,
         )
 
         if unpaywall_client is not None:
@@ -239,7 +241,7 @@ class RetrievalClient:
 
         # If Unpaywall is enabled, enrich papers so pdf_url is populated when possible.
         if self._paper_enrichment_service:
-            papers = [self._paper_enrichment_service.enrich(paper) for paper in papers]
+            papers = self._paper_enrichment_service.enrich_many(papers)
 
         chunks = self._evidence_service.gather(papers)
         self.session_index.evidence_chunks[query] = chunks
@@ -250,6 +252,13 @@ class RetrievalClient:
 
         self.session_index.reset()
 
+    def close(self) -> None:
+        """Release the worker threads held by the search and resolver services."""
+
+        self._search_service.close()
+        self._doi_resolver.close()
+        self._full_text_resolver.close()
+
     def _dedupe_citing_papers(self, papers: List[Paper]) -> List[Paper]:
         out: List[Paper] = []
         seen: Set[str] = set()
@@ -1,7 +1,7 @@
 """Core data models, identifiers, and configuration for literature_retrieval_engine."""
 
 from .identifiers import normalize_doi, normalize_title
-from .matching import jaccard, title_tokens
+from .matching import jaccard, jaccard_upper_bound, title_tokens
 from .models import Paper
 from .session import SessionIndex
 from .settings import RetrievalSettings
@@ -13,5 +13,6 @@ __all__ = [
     "normalize_doi",
     "normalize_title",
     "jaccard",
+    "jaccard_upper_bound",
     "title_tokens",
 ]
@@ -2,32 +2,39 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from functools import lru_cache
 
-_DOI_PREFIX_PATTERN = re.compile(r"^(https?://)?(dx\.)?doi\.org/", re.IGNORECASE)
+_DOI_PREFIX_PATTERN = re.compile(r"^(?:https?://)?(?:dx\.)?doi\.org/", re.ASCII | re.IGNORECASE)
 
 
+@lru_cache(maxsize=65536)
 def normalize_doi(doi: str | None) -> str | None:
     """Normalize a DOI string into a canonical lowercase form.
 
     The normalization removes leading DOI prefixes (e.g., ``https://doi.org/`` or
     ``doi:``), trims whitespace, and lowercases the remaining identifier. Empty
-    or missing values return ``None``.
+    or missing values return ``None``. Results are memoized because the same
+    DOIs are normalized repeatedly across adapters, grouping and merging.
     """
 
     if not doi:
         return None
 
-    cleaned = doi.strip()
-    cleaned = _DOI_PREFIX_PATTERN.sub("", cleaned)
-    if cleaned.lower().startswith("doi:"):
-        cleaned = cleaned.split(":", 1)[1]
-    cleaned = cleaned.strip().lower()
+    cleaned = _DOI_PREFIX_PATTERN.sub("", doi.strip()).lower()
+    if cleaned.startswith("doi:"):
+        cleaned = cleaned[4:]
+    cleaned = cleaned.strip()
 
     return cleaned or None
 
 
+@lru_cache(maxsize=16384)
 def normalize_title(title: str | None) -> str:
-    """Normalize a title by collapsing whitespace and normalizing unicode."""
+    """Normalize a title by collapsing whitespace and normalizing unicode.
+
+    Memoized like :func:`normalize_doi`; titles and author names are normalized
+    again for every group key and resolver match they take part in.
+    """
 
     if not title:
         return ""
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from typing import Iterable, Set
+from typing import AbstractSet, Iterable, Set
 
 from literature_retrieval_engine.core.identifiers import normalize_title
 
@@ -19,8 +19,8 @@ def title_tokens(title: str | None) -> Set[str]:
 def jaccard(a: Iterable[str], b: Iterable[str]) -> float:
     """Compute the Jaccard similarity between two collections of tokens."""
 
-    set_a = set(a)
-    set_b = set(b)
+    set_a = a if isinstance(a, AbstractSet) else set(a)
+    set_b = b if isinstance(b, AbstractSet) else set(b)
 
     if not set_a and not set_b:
         return 1.0
@@ -30,3 +30,16 @@ def jaccard(a: Iterable[str], b: Iterable[str]) -> float:
         return 0.0
 
     return len(set_a & set_b) / len(union)
+
+
+def jaccard_upper_bound(size_a: int, size_b: int) -> float:
+    """Return the highest Jaccard similarity possible for sets of the given sizes.
+
+    The overlap of two sets is at most the smaller set and their union at least
+    the larger one, so this bound can be checked before computing the exact
+    similarity.
+    """
+
+    if not size_a and not size_b:
+        return 1.0
+    return min(size_a, size_b) / max(size_a, size_b)
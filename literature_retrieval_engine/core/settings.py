@@ -27,6 +27,8 @@ class RetrievalSettings:
     # Practical caps to avoid unbounded citation crawls.
     citation_limit: int = 500
     openalex_citation_max_pages: int = 5
+    # Seconds identical searches reuse earlier results; 0 disables the cache.
+    search_cache_ttl: float = 300.0
     session: Optional[requests.Session] = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
@@ -38,6 +40,10 @@ class RetrievalSettings:
         if env_timeout and self.timeout == 10.0:
             self.timeout = float(env_timeout)
 
+        env_search_cache_ttl = self._get_env_value("RETRIEVAL_SEARCH_CACHE_TTL_S")
+        if env_search_cache_ttl and self.search_cache_ttl == 300.0:
+            self.search_cache_ttl = float(env_search_cache_ttl)
+
         env_unpaywall_email = self._get_env_value("RETRIEVAL_UNPAYWALL_EMAIL")
         if env_unpaywall_email and self.unpaywall_email is None:
             self.unpaywall_email = env_unpaywall_email
@@ -52,7 +58,9 @@ class RetrievalSettings:
         if self.session is not None:
             session = self.session
         else:
-            session = requests.Session()
+            from literature_retrieval_engine.providers.clients.base import new_pooled_session
+
+            session = new_pooled_session()
 
         if self.user_agent:
             session.headers.setdefault("User-Agent", self.user_agent)
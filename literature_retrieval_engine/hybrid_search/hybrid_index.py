@@ -70,18 +70,19 @@ class HybridRetriever:
         raw_score_attr: str,
         rank_attr: str,
     ) -> None:
+        rrf_k = self.config.rrf_k
+        include_ranks = self.config.include_ranks
         for rank, (chunk, score) in enumerate(results, start=1):
-            fused_score = weight / (self.config.rrf_k + rank)
-            if chunk.chunk_id not in fused:
-                fused[chunk.chunk_id] = RetrievedChunk(
-                    chunk=chunk,
-                    fused_score=fused_score,
-                )
+            fused_score = weight / (rrf_k + rank)
+            entry = fused.get(chunk.chunk_id)
+            if entry is None:
+                entry = RetrievedChunk(chunk=chunk, fused_score=fused_score)
+                fused[chunk.chunk_id] = entry
             else:
-                fused[chunk.chunk_id].fused_score += fused_score
-            setattr(fused[chunk.chunk_id], raw_score_attr, score)
-            if self.config.include_ranks:
-                setattr(fused[chunk.chunk_id], rank_attr, rank)
+                entry.fused_score += fused_score
+            setattr(entry, raw_score_attr, score)
+            if include_ranks:
+                setattr(entry, rank_attr, rank)
 
 
 __all__ = ["HybridRetriever", "HybridRetrievalConfig"]
@@ -7,7 +7,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from literature_retrieval_engine.services import PaperChunk
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     """Lightweight representation of a retrievable text chunk."""
 
@@ -45,7 +45,7 @@ class Chunk:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrievedChunk:
     """Enriched retrieval output including fused and per-modality scores."""
 
@@ -9,10 +9,12 @@ from literature_retrieval_engine.providers.clients.semanticscholar import Semant
 
 
 def crossref_work_to_paper(work: CrossrefWork) -> Paper:
+    doi = work.doi
+    title = work.title
     return Paper(
-        paper_id=work.doi or work.title or "",
-        title=work.title or "",
-        doi=normalize_doi(work.doi),
+        paper_id=doi or title or "",
+        title=title or "",
+        doi=normalize_doi(doi),
         abstract=None,
         year=work.year,
         venue=work.venue,
@@ -23,10 +25,12 @@ def crossref_work_to_paper(work: CrossrefWork) -> Paper:
 
 
 def datacite_work_to_paper(work: DataCiteWork) -> Paper:
+    doi = work.doi
+    title = work.title
     return Paper(
-        paper_id=work.doi or work.title or "",
-        title=work.title or "",
-        doi=normalize_doi(work.doi),
+        paper_id=doi or title or "",
+        title=title or "",
+        doi=normalize_doi(doi),
         abstract=None,
         year=work.year,
         venue=work.venue,
@@ -37,10 +41,12 @@ def datacite_work_to_paper(work: DataCiteWork) -> Paper:
 
 
 def openalex_work_to_paper(work: OpenAlexWork) -> Paper:
+    doi = work.doi
+    title = work.title
     return Paper(
-        paper_id=work.openalex_id or work.doi or work.title or "",
-        title=work.title or "",
-        doi=normalize_doi(work.doi),
+        paper_id=work.openalex_id or doi or title or "",
+        title=title or "",
+        doi=normalize_doi(doi),
         abstract=work.abstract,
         year=work.year,
         venue=work.venue,
@@ -53,16 +59,19 @@ def openalex_work_to_paper(work: OpenAlexWork) -> Paper:
 
 
 def semanticscholar_paper_to_paper(record: SemanticScholarPaper) -> Paper:
+    doi = record.doi
+    title = record.title
+    pdf_url = record.pdf_url
     return Paper(
-        paper_id=record.paper_id or record.doi or record.title or "",
-        title=record.title or "",
-        doi=normalize_doi(record.doi),
+        paper_id=record.paper_id or doi or title or "",
+        title=title or "",
+        doi=normalize_doi(doi),
         abstract=record.abstract,
         year=record.year,
         venue=record.venue,
         source="semanticscholar",
         url=record.url,
-        pdf_url=record.pdf_url,
-        is_oa=bool(record.pdf_url),
+        pdf_url=pdf_url,
+        is_oa=bool(pdf_url),
         authors=record.authors,
     )
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import logging
 import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import (
     RetryCallState,
     retry,
@@ -17,8 +19,18 @@ from tenacity import (
     wait_exponential,
 )
 
+_orjson_loads: Optional[Callable[[bytes], Any]]
+try:  # pragma: no cover - optional dependency
+    import orjson
+
+    _orjson_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson_loads = None
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 DEFAULT_HEADERS: Dict[str, str] = {
     "User-Agent": "scientific-retrieval-engine",
     "Accept": "application/json",
@@ -36,6 +48,14 @@ RATE_LIMIT_WAIT_MULTIPLIER = 0.75
 RATE_LIMIT_WAIT_MIN_SECONDS = 1.0
 RATE_LIMIT_WAIT_MAX_SECONDS = 12
 
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Keep-alive pool sizing for sessions created by this package. The pool is
+# larger than DEFAULT_MAX_CONCURRENCY so batched lookups never block on a
+# free connection.
+DEFAULT_POOL_CONNECTIONS = 32
+DEFAULT_POOL_MAXSIZE = 32
+
 _shared_session: Optional[requests.Session] = None
 
 
@@ -84,12 +104,29 @@ class RetryableResponseError(Exception):
         self.response = response
 
 
+def new_pooled_session() -> requests.Session:
+    """Return a new :class:`requests.Session` with a sized keep-alive pool.
+
+    Retries are intentionally not configured on the adapter; they are handled
+    by :class:`BaseHttpClient` so the retry budget is not applied twice.
+    """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def _get_shared_session() -> requests.Session:
     """Return a shared :class:`requests.Session` with default headers."""
 
     global _shared_session
     if _shared_session is None:
-        _shared_session = requests.Session()
+        _shared_session = new_pooled_session()
         _shared_session.headers.update(DEFAULT_HEADERS)
     else:
         for key, value in DEFAULT_HEADERS.items():
@@ -97,6 +134,19 @@ def _get_shared_session() -> requests.Session:
     return _shared_session
 
 
+def decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using ``orjson`` when it is installed.
+
+    ``orjson`` parses the raw bytes directly, skipping the text decoding step
+    performed by :meth:`requests.Response.json`. Without it this falls back to
+    the standard library decoder.
+    """
+
+    if _orjson_loads is None:
+        return response.json()
+    return _orjson_loads(response.content)
+
+
 def _parse_retry_after(value: Optional[str]) -> Optional[float]:
     if not value:
         return None
@@ -284,3 +334,24 @@ class BaseHttpClient:
             raise RequestRejectedError(status, f"{message} ({status})", body_excerpt=excerpt)
         return response
 
+    def _map_concurrently(
+        self,
+        func: Callable[[str], T],
+        items: Sequence[str],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[T]:
+        """Apply ``func`` to each item using a bounded thread pool.
+
+        Results are returned in input order. All workers share ``self.session``
+        so keep-alive connections are reused across the batch. Exceptions raised
+        by ``func`` propagate to the caller once the batch completes.
+        """
+
+        if not items:
+            return []
+        workers = min(max(1, max_concurrency), len(items))
+        if workers == 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items))
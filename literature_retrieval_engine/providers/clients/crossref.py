@@ -6,10 +6,14 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 from literature_retrieval_engine.core.identifiers import normalize_doi
-from literature_retrieval_engine.providers.clients.base import BaseHttpClient, NotFoundError
+from literature_retrieval_engine.providers.clients.base import (
+    DEFAULT_MAX_CONCURRENCY,
+    BaseHttpClient,
+    NotFoundError,
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossrefWork:
     doi: Optional[str]
     title: Optional[str]
@@ -37,6 +41,13 @@ class CrossrefClient(BaseHttpClient):
         payload = response.json().get("message", {})
         return self._normalize_work(payload)
 
+    def works_by_dois(
+        self, dois: List[str], *, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[Optional[CrossrefWork]]:
+        """Fetch several DOIs concurrently, preserving the input order."""
+
+        return self._map_concurrently(self.works_by_doi, dois, max_concurrency=max_concurrency)
+
     def search_by_title(
         self,
         title: str,
@@ -78,53 +89,50 @@ class CrossrefClient(BaseHttpClient):
         if not isinstance(data, dict):
             return None
 
-        doi = normalize_doi(data.get("DOI"))
-        title_parts = data.get("title") or []
+        get = data.get
+        doi = normalize_doi(get("DOI"))
+        title_parts = get("title")
         title = title_parts[0] if isinstance(title_parts, list) and title_parts else None
-        authors = self._extract_authors(data.get("author") or [])
-        year = self._extract_year(data)
-        venue = self._extract_venue(data)
-        url = data.get("URL")
-
         if not title and not doi:
             return None
 
+        year = _date_parts_year(get("issued"))
+        if year is None:
+            year = _date_parts_year(get("published-print"))
+        if year is None:
+            year = _date_parts_year(get("published-online"))
+
+        authors: List[str] = []
+        append = authors.append
+        for author in get("author") or ():
+            try:
+                family = author.get("family")
+                given = author.get("given")
+            except AttributeError:
+                continue
+            if family and given:
+                append(f"{given} {family}")
+            elif family or given:
+                append(str(family or given))
+
+        container_title = get("container-title")
+        venue = container_title[0] if isinstance(container_title, list) and container_title else None
+
         return CrossrefWork(
             doi=doi,
             title=title,
             year=year,
             venue=venue,
-            url=url,
+            url=get("URL"),
             authors=authors,
         )
 
-    def _extract_year(self, data: Dict[str, Any]) -> Optional[int]:
-        for key in ("issued", "published-print", "published-online"):
-            component = data.get(key, {})
-            if not isinstance(component, dict):
-                continue
-            parts = component.get("date-parts")
-            if isinstance(parts, list) and parts and isinstance(parts[0], list) and parts[0]:
-                year = parts[0][0]
-                if isinstance(year, int):
-                    return year
-        return None
 
-    def _extract_authors(self, authors: List[Dict[str, Any]]) -> List[str]:
-        extracted: List[str] = []
-        for author in authors:
-            if not isinstance(author, dict):
-                continue
-            family = author.get("family")
-            given = author.get("given")
-            if family and given:
-                extracted.append(f"{given} {family}")
-            elif family or given:
-                extracted.append(str(family or given))
-        return extracted
+def _date_parts_year(component: Any) -> Optional[int]:
+    """Return the year from a Crossref ``date-parts`` component, if present."""
 
-    def _extract_venue(self, data: Dict[str, Any]) -> Optional[str]:
-        container_title = data.get("container-title")
-        if isinstance(container_title, list) and container_title:
-            return container_title[0]
+    try:
+        year = component["date-parts"][0][0]
+    except (KeyError, TypeError, IndexError):
         return None
+    return year if isinstance(year, int) else None
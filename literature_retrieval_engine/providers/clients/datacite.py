@@ -6,10 +6,14 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 from literature_retrieval_engine.core.identifiers import normalize_doi
-from literature_retrieval_engine.providers.clients.base import BaseHttpClient, NotFoundError
+from literature_retrieval_engine.providers.clients.base import (
+    DEFAULT_MAX_CONCURRENCY,
+    BaseHttpClient,
+    NotFoundError,
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class DataCiteWork:
     doi: Optional[str]
     title: Optional[str]
@@ -37,6 +41,13 @@ class DataCiteClient(BaseHttpClient):
         payload = response.json().get("data") or {}
         return self._normalize_work(payload)
 
+    def get_by_dois(
+        self, dois: List[str], *, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[Optional[DataCiteWork]]:
+        """Fetch several DOIs concurrently, preserving the input order."""
+
+        return self._map_concurrently(self.get_by_doi, dois, max_concurrency=max_concurrency)
+
     def search_by_title(self, title: str, *, rows: int = 5) -> List[DataCiteWork]:
         if not title:
             return []
@@ -102,19 +113,21 @@ class DataCiteClient(BaseHttpClient):
 
     def _extract_authors(self, creators: List[Dict[str, Any]]) -> List[str]:
         extracted: List[str] = []
+        append = extracted.append
         for creator in creators:
-            if not isinstance(creator, dict):
-                continue
-            name = creator.get("name") or creator.get("creatorName")
-            if name:
-                extracted.append(str(name))
+            try:
+                name = creator.get("name") or creator.get("creatorName")
+                if name:
+                    append(str(name))
+                    continue
+                given = creator.get("givenName")
+                family = creator.get("familyName")
+            except AttributeError:
                 continue
-            given = creator.get("givenName")
-            family = creator.get("familyName")
             if given and family:
-                extracted.append(f"{given} {family}")
+                append(f"{given} {family}")
             elif given or family:
-                extracted.append(str(given or family))
+                append(str(given or family))
         return extracted
 
     def _extract_year(self, year_value: Any) -> Optional[int]:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from urllib.parse import quote
 
 from literature_retrieval_engine.core.identifiers import normalize_doi
@@ -20,6 +20,12 @@ from literature_retrieval_engine.providers.clients.base import (
 
 logger = logging.getLogger(__name__)
 
+_DOI_URL_PREFIX = "https://doi.org/"
+_OPENALEX_URL_PREFIX = "https://openalex.org/"
+
+# OpenAlex accepts at most 100 alternatives in a single OR filter.
+DOI_FILTER_BATCH_SIZE = 50
+
 
 @dataclass
 class OpenAlexWork:
@@ -61,7 +67,7 @@ class OpenAlexClient(BaseHttpClient):
         if not normalized_doi:
             return None
 
-        doi_url = f"https://doi.org/{normalized_doi}"
+        doi_url = _DOI_URL_PREFIX + normalized_doi
         work = self.get_work_by_external_id(doi_url)
         if work is None:
             work = self.get_work_by_doi_filter(doi_url)
@@ -70,28 +76,31 @@ class OpenAlexClient(BaseHttpClient):
     def get_work_by_doi_filter(self, doi_url: str) -> Optional[OpenAlexWork]:
         """Fetch a work using the DOI filter fallback."""
 
-        params: Dict[str, Any] = {"filter": f"doi:{doi_url}"}
-        try:
-            response = self._request("GET", "/works", params=params)
-        except NotFoundError:
-            self._log_failed_request("doi_filter", doi_url, status=404, detail="Not found")
-            return None
-        except (RequestRejectedError, UnauthorizedError, ForbiddenError) as exc:
-            self._log_failed_request("doi_filter", doi_url, status=exc.status, detail=exc.body_excerpt)
-            return None
-        except RateLimitedError as exc:
-            self._log_failed_request("doi_filter", doi_url, status=429, detail=str(exc))
-            return None
-        except UpstreamError as exc:
-            self._log_failed_request("doi_filter", doi_url, status=None, detail=str(exc))
-            return None
-
-        payload = response.json()
-        results = payload.get("results") or []
+        results = self._filter_works_by_doi(doi_url)
         if not results:
             return None
         return self._normalize_work(results[0])
 
+    def get_works_by_dois(self, dois: Sequence[str]) -> List[Optional[OpenAlexWork]]:
+        """Fetch several works with OR-ed ``doi:`` filters, preserving the input order.
+
+        DOIs are sent in blocks of :data:`DOI_FILTER_BATCH_SIZE`. The result has
+        one entry per input DOI, with ``None`` for DOIs that are invalid, unknown
+        to OpenAlex, or part of a block whose request failed.
+        """
+
+        normalized_dois = [normalize_doi(doi) for doi in dois]
+        unique_dois = list(dict.fromkeys(doi for doi in normalized_dois if doi))
+        works_by_doi: Dict[str, OpenAlexWork] = {}
+        for start in range(0, len(unique_dois), DOI_FILTER_BATCH_SIZE):
+            block = unique_dois[start : start + DOI_FILTER_BATCH_SIZE]
+            doi_urls = "|".join(_DOI_URL_PREFIX + doi for doi in block)
+            for item in self._filter_works_by_doi(doi_urls, per_page=len(block)):
+                work = self._normalize_work(item)
+                if work.doi:
+                    works_by_doi.setdefault(work.doi, work)
+        return [works_by_doi.get(doi) if doi else None for doi in normalized_dois]
+
     def search_works(
         self,
         query: str,
@@ -143,11 +152,35 @@ class OpenAlexClient(BaseHttpClient):
                 filters={"cites": openalex_work_id},
             )
             works.extend(batch)
-            if not next_cursor:
+            # A short page is the last one; don't spend a round trip fetching the empty page after it.
+            if not next_cursor or len(batch) < per_page:
                 break
             current_cursor = next_cursor
         return works
 
+    def _filter_works_by_doi(self, doi_urls: str, *, per_page: Optional[int] = None) -> List[Dict[str, Any]]:
+        params: Dict[str, Any] = {"filter": f"doi:{doi_urls}"}
+        if per_page is not None:
+            params["per-page"] = per_page
+        try:
+            response = self._request("GET", "/works", params=params)
+        except NotFoundError:
+            self._log_failed_request("doi_filter", doi_urls, status=404, detail="Not found")
+            return []
+        except (RequestRejectedError, UnauthorizedError, ForbiddenError) as exc:
+            self._log_failed_request("doi_filter", doi_urls, status=exc.status, detail=exc.body_excerpt)
+            return []
+        except RateLimitedError as exc:
+            self._log_failed_request("doi_filter", doi_urls, status=429, detail=str(exc))
+            return []
+        except UpstreamError as exc:
+            self._log_failed_request("doi_filter", doi_urls, status=None, detail=str(exc))
+            return []
+
+        payload = response.json()
+        results: List[Dict[str, Any]] = payload.get("results") or []
+        return results
+
     def _get_work_by_path(self, path: str, *, identifier: str) -> Optional[OpenAlexWork]:
         try:
             response = self._request("GET", path)
@@ -201,7 +234,7 @@ class OpenAlexClient(BaseHttpClient):
 
         return OpenAlexWork(
             openalex_id=openalex_id,
-            openalex_url=f"https://openalex.org/{openalex_id}" if openalex_id else "",
+            openalex_url=_OPENALEX_URL_PREFIX + openalex_id if openalex_id else "",
             doi=doi,
             title=title,
             year=year,
@@ -13,12 +13,19 @@ from literature_retrieval_engine.providers.clients.base import (
     NotFoundError,
     RateLimitedError,
     RequestRejectedError,
+    decode_json,
 )
 
 DEFAULT_FIELDS = "paperId,externalIds,title,abstract,year,venue,authors.name,url,openAccessPdf"
 
+# Maximum number of identifiers accepted by ``POST /paper/batch``.
+BATCH_SIZE = 500
 
-@dataclass
+# Shared read-only fallback for papers without ``externalIds``.
+_EMPTY_EXTERNAL_IDS: Dict[str, Any] = {}
+
+
+@dataclass(slots=True)
 class SemanticScholarPaper:
     """Normalized representation of a Semantic Scholar paper."""
 
@@ -86,7 +93,7 @@ class SemanticScholarClient(BaseHttpClient):
         response = self._request(
             "GET", "/paper/search", params=params, headers=self._auth_headers()
         )
-        payload = response.json()
+        payload = decode_json(response)
         return [self._normalize_paper(item) for item in payload.get("data", []) if isinstance(item, dict)]
 
     def search_papers_advanced(
@@ -125,7 +132,7 @@ class SemanticScholarClient(BaseHttpClient):
                 fields=fields,
             )
 
-        data = response.json()
+        data = decode_json(response)
         return [self._normalize_paper(item) for item in data.get("data", []) if isinstance(item, dict)]
 
     def get_by_doi(
@@ -145,7 +152,41 @@ class SemanticScholarClient(BaseHttpClient):
         except NotFoundError:
             return None
 
-        return self._normalize_paper(response.json())
+        return self._normalize_paper(decode_json(response))
+
+    def get_by_dois(
+        self, dois: List[str], *, fields: str = DEFAULT_FIELDS
+    ) -> List[Optional[SemanticScholarPaper]]:
+        """Fetch several DOIs through ``POST /paper/batch``.
+
+        Identifiers are sent in blocks of :data:`BATCH_SIZE`. The result has one
+        entry per input DOI, in order, with ``None`` for DOIs that are invalid or
+        unknown to Semantic Scholar.
+        """
+
+        results: List[Optional[SemanticScholarPaper]] = [None] * len(dois)
+        positions: List[int] = []
+        ids: List[str] = []
+        for position, doi in enumerate(dois):
+            normalized_doi = normalize_doi(doi)
+            if normalized_doi:
+                positions.append(position)
+                ids.append(f"DOI:{normalized_doi}")
+
+        for start in range(0, len(ids), BATCH_SIZE):
+            end = start + BATCH_SIZE
+            response = self._request(
+                "POST",
+                "/paper/batch",
+                params={"fields": fields},
+                json={"ids": ids[start:end]},
+                headers=self._auth_headers(),
+            )
+            payload = decode_json(response) or []
+            for position, item in zip(positions[start:end], payload):
+                if isinstance(item, dict):
+                    results[position] = self._normalize_paper(item)
+        return results
 
     def get_citations(
         self,
@@ -187,7 +228,7 @@ class SemanticScholarClient(BaseHttpClient):
                 },
                 headers=self._auth_headers(),
             )
-            payload = response.json()
+            payload = decode_json(response)
             batch = payload.get("data", []) or []
             if not batch:
                 break
@@ -209,22 +250,25 @@ class SemanticScholarClient(BaseHttpClient):
         return results
 
     def _normalize_paper(self, data: Dict[str, Any]) -> SemanticScholarPaper:
-        doi = normalize_doi(data.get("doi") or data.get("externalIds", {}).get("DOI"))
+        external_ids = data.get("externalIds") or _EMPTY_EXTERNAL_IDS
+        doi = normalize_doi(data.get("doi") or external_ids.get("DOI"))
         authors: List[str] = []
-        for author in data.get("authors", []) or []:
-            if not isinstance(author, dict):
+        append = authors.append
+        for author in data.get("authors") or ():
+            try:
+                name = author.get("name")
+            except AttributeError:
                 continue
-            name = author.get("name")
             if name:
-                authors.append(name)
-                
+                append(name)
+
         open_access_pdf = data.get("openAccessPdf") or {}
         pdf_url = open_access_pdf.get("url") if isinstance(open_access_pdf, dict) else None
 
         return SemanticScholarPaper(
             paper_id=str(
                 data.get("paperId")
-                or data.get("externalIds", {}).get("CorpusId")
+                or external_ids.get("CorpusId")
                 or doi
                 or data.get("title")
                 or ""
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence
 
 from literature_retrieval_engine.core.identifiers import normalize_doi
-from literature_retrieval_engine.providers.clients.base import BaseHttpClient, ClientError, NotFoundError
+from literature_retrieval_engine.providers.clients.base import (
+    DEFAULT_MAX_CONCURRENCY,
+    BaseHttpClient,
+    ClientError,
+    NotFoundError,
+    decode_json,
+)
 
 
 @dataclass
@@ -85,21 +92,34 @@ class UnpaywallClient(BaseHttpClient):
             response = self._request("GET", f"/{normalized_doi}", params={"email": self.email})
         except NotFoundError:
             return None
-        payload = response.json()
+        payload = decode_json(response)
         return self._parse_record(payload)
 
-    def _parse_record(self, payload: dict) -> UnpaywallRecord:
-        locations = [
-            self._parse_location(location)
-            for location in payload.get("oa_locations", [])
-            if isinstance(location, dict)
-        ]
+    def get_records(
+        self, dois: Sequence[str], *, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[Optional[UnpaywallRecord]]:
+        """Fetch records for several DOIs concurrently, preserving the input order."""
 
-        best_location_data = payload.get("best_oa_location")
-        best_location = self._parse_location(best_location_data) if isinstance(best_location_data, dict) else None
+        return self._map_concurrently(self.get_record, dois, max_concurrency=max_concurrency)
 
-        if best_location and best_location not in locations:
-            locations.insert(0, best_location)
+    def _parse_record(self, payload: dict) -> UnpaywallRecord:
+        seen_keys: set[tuple[str, Optional[str]]] = set()
+        locations: List[OpenAccessLocation] = []
+        for location_data in payload.get("oa_locations") or ():
+            if not isinstance(location_data, dict):
+                continue
+            key = (location_data.get("url") or "", location_data.get("url_for_pdf"))
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+            locations.append(self._parse_location(location_data))
+
+        best_location: Optional[OpenAccessLocation] = None
+        best_location_data = payload.get("best_oa_location")
+        if isinstance(best_location_data, dict):
+            best_location = self._parse_location(best_location_data)
+            if (best_location.url, best_location.url_for_pdf) not in seen_keys:
+                locations = [best_location, *locations]
 
         return UnpaywallRecord(
             doi=normalize_doi(payload.get("doi")) or "",
@@ -112,13 +132,19 @@ class UnpaywallClient(BaseHttpClient):
         return OpenAccessLocation(
             url=data.get("url") or "",
             url_for_pdf=data.get("url_for_pdf"),
-            version=data.get("version"),
-            license=data.get("license"),
-            host_type=data.get("host_type"),
+            version=_intern(data.get("version")),
+            license=_intern(data.get("license")),
+            host_type=_intern(data.get("host_type")),
             is_best=bool(data.get("is_best")),
         )
 
 
+def _intern(value: Any) -> Any:
+    """Intern low-cardinality string fields so repeated values share one object."""
+
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def resolve_full_text(
     *,
     doi: str,
@@ -147,3 +173,22 @@ def resolve_full_text(
         )
 
     return None
+
+
+def resolve_full_text_many(
+    *,
+    dois: Sequence[str],
+    unpaywall_client: UnpaywallClient,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[Optional[UnpaywallFullTextCandidate]]:
+    """Resolve full text for several DOIs with bounded concurrency.
+
+    Each DOI is handled exactly like :func:`resolve_full_text`; results are
+    returned in input order with ``None`` for DOIs without an open-access PDF.
+    """
+
+    return unpaywall_client._map_concurrently(
+        lambda doi: resolve_full_text(doi=doi, title="", unpaywall_client=unpaywall_client),
+        dois,
+        max_concurrency=max_concurrency,
+    )
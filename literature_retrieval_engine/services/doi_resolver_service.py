@@ -15,12 +15,14 @@ doi = resolver.resolve_doi_from_title(
 from __future__ import annotations
 
 import logging
-from typing import List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Set, Tuple, Union
 
 from literature_retrieval_engine.core.identifiers import normalize_title
-from literature_retrieval_engine.core.matching import jaccard, title_tokens
-from literature_retrieval_engine.providers.clients.crossref import CrossrefClient
-from literature_retrieval_engine.providers.clients.datacite import DataCiteClient
+from literature_retrieval_engine.core.matching import jaccard, jaccard_upper_bound, title_tokens
+from literature_retrieval_engine.providers.clients.base import DEFAULT_MAX_CONCURRENCY
+from literature_retrieval_engine.providers.clients.crossref import CrossrefClient, CrossrefWork
+from literature_retrieval_engine.providers.clients.datacite import DataCiteClient, DataCiteWork
 
 logger = logging.getLogger(__name__)
 
@@ -42,21 +44,40 @@ class DoiResolverService:
         self.crossref = crossref or CrossrefClient()
         self.datacite = datacite if datacite is not None else DataCiteClient()
         self.min_similarity = min_similarity
+        # Shared by concurrent callers, e.g. the search service upgrading several titles at once.
+        self._executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_CONCURRENCY)
+
+    def close(self) -> None:
+        """Release the worker threads used for the registry searches."""
+
+        self._executor.shutdown(wait=False)
 
     def resolve_doi_from_title(
         self, title: str, expected_authors: Optional[List[str]] = None
     ) -> Optional[str]:
         normalized_target = normalize_title(title)
-        target_tokens = title_tokens(title)
         if not normalized_target:
             return None
+        target_tokens = frozenset(title_tokens(normalized_target))
 
-        resolver_candidates = [("crossref", self.crossref.search_by_title(title, rows=5))]
+        resolver_candidates: List[Tuple[str, Sequence[Union[CrossrefWork, DataCiteWork]]]]
         if self.datacite:
-            resolver_candidates.append(("datacite", self.datacite.search_by_title(title, rows=5)))
+            # Both registries are queried up front so their round-trips overlap;
+            # Crossref matches still take precedence below.
+            crossref_future = self._executor.submit(self.crossref.search_by_title, title, rows=5)
+            datacite_future = self._executor.submit(self.datacite.search_by_title, title, rows=5)
+            resolver_candidates = [
+                ("crossref", crossref_future.result()),
+                ("datacite", datacite_future.result()),
+            ]
+        else:
+            resolver_candidates = [("crossref", self.crossref.search_by_title(title, rows=5))]
         expected_author_set: Set[str] = set()
         if expected_authors:
             expected_author_set = {normalize_title(author) for author in expected_authors if author}
+        # An exact title plus (when authors are expected) an author overlap cannot
+        # be outscored, and ties keep the earlier candidate.
+        max_score = 2.0 if expected_author_set else 1.0
 
         for source, candidates in resolver_candidates:
             best_doi: Optional[str] = None
@@ -72,10 +93,13 @@ class DoiResolverService:
                 if not normalized_candidate:
                     continue
 
-                candidate_tokens = title_tokens(candidate.title)
-                similarity = (
-                    1.0 if normalized_candidate == normalized_target else jaccard(target_tokens, candidate_tokens)
-                )
+                if normalized_candidate == normalized_target:
+                    similarity = 1.0
+                else:
+                    candidate_tokens = title_tokens(normalized_candidate)
+                    if jaccard_upper_bound(len(target_tokens), len(candidate_tokens)) < self.min_similarity:
+                        continue
+                    similarity = jaccard(target_tokens, candidate_tokens)
 
                 if similarity < self.min_similarity:
                     continue
@@ -97,6 +121,8 @@ class DoiResolverService:
                     best_doi = candidate.doi
                     best_similarity = similarity
                     best_author_overlap = author_overlap
+                    if score >= max_score:
+                        break
 
             if best_doi:
                 logger.info(
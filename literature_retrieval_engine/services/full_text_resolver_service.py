@@ -1,15 +1,37 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from typing import List, Optional, Protocol, Sequence
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from itertools import chain
+from typing import Callable, Dict, Hashable, List, Optional, Protocol, Sequence, Tuple, cast
 
 from literature_retrieval_engine.core.models import Paper
-from literature_retrieval_engine.providers.clients.base import ClientError
-from literature_retrieval_engine.providers.clients.unpaywall import OpenAccessLocation, UnpaywallClient
+from literature_retrieval_engine.providers.clients.base import DEFAULT_MAX_CONCURRENCY, ClientError
+from literature_retrieval_engine.providers.clients.unpaywall import (
+    OpenAccessLocation,
+    UnpaywallClient,
+    UnpaywallRecord,
+)
 
+_RECORD_CACHE_SIZE = 4096
+_RESOLUTION_CACHE_SIZE = 2048
+# DOI registrants Unpaywall has no open-access records for (arXiv is covered by ArxivDeterministicResolver).
+_UNPAYWALL_SKIP_PREFIXES: tuple[str, ...] = ("10.48550/arxiv.",)
 
-@dataclass(frozen=True)
+# With only built-in resolvers: (doi, pdf_url, url, is_oa), every Paper field they and the OA
+# signal read. Custom resolvers may read anything, so the key then covers every Paper field.
+_ResolutionKey = Tuple[Hashable, ...]
+
+
+class _LookupFailed(Exception):
+    """A resolver's upstream lookup failed transiently; its empty result must not be cached."""
+
+
+@dataclass(frozen=True, slots=True)
 class FullTextCandidate:
     pdf_url: str
     source: str
@@ -19,7 +41,7 @@ class FullTextCandidate:
     is_best: Optional[bool] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FullTextResolution:
     candidates: List[FullTextCandidate]
     oa_signal: Optional[bool] = None
@@ -35,7 +57,7 @@ class FullTextResolver(Protocol):
 
 
 class UpstreamFieldsResolver:
-    name = "upstream_fields"
+    name = sys.intern("upstream_fields")
 
     def resolve(self, paper: Paper) -> List[FullTextCandidate]:
         if not paper.pdf_url:
@@ -44,50 +66,73 @@ class UpstreamFieldsResolver:
 
 
 class ArxivDeterministicResolver:
-    name = "arxiv"
+    name = sys.intern("arxiv")
 
-    _ARXIV_DOI_RE = re.compile(r"^10\.48550/arxiv\.(?P<id>.+)$", re.IGNORECASE)
+    _ARXIV_DOI_PREFIX = "10.48550/arxiv."
+    _ARXIV_URL_RE = re.compile(r"arxiv\.org/abs/([^?#\s]+)", re.ASCII)
 
     def resolve(self, paper: Paper) -> List[FullTextCandidate]:
         doi = (paper.doi or "").strip()
-        if doi:
-            match = self._ARXIV_DOI_RE.match(doi)
+        prefix_length = len(self._ARXIV_DOI_PREFIX)
+        arxiv_id: Optional[str] = None
+        if doi[:prefix_length].lower() == self._ARXIV_DOI_PREFIX:
+            arxiv_id = doi[prefix_length:]
+        if not arxiv_id and paper.url:
+            match = self._ARXIV_URL_RE.search(paper.url)
             if match:
-                arxiv_id = match.group("id")
-                return [
-                    FullTextCandidate(
-                        pdf_url=f"https://arxiv.org/pdf/{arxiv_id}.pdf",
-                        source=self.name,
-                    )
-                ]
-        url = (paper.url or "").strip()
-        if "arxiv.org/abs/" in url:
-            arxiv_id = url.split("arxiv.org/abs/", 1)[1].split("?", 1)[0]
-            if arxiv_id:
-                return [
-                    FullTextCandidate(
-                        pdf_url=f"https://arxiv.org/pdf/{arxiv_id}.pdf",
-                        source=self.name,
-                    )
-                ]
-        return []
+                arxiv_id = match.group(1)
+        if not arxiv_id:
+            return []
+        return [FullTextCandidate(pdf_url=f"https://arxiv.org/pdf/{arxiv_id}.pdf", source=self.name)]
 
 
 class UnpaywallResolver:
-    name_best = "unpaywall"
-    name_location = "unpaywall_location"
+    name_best = sys.intern("unpaywall")
+    name_location = sys.intern("unpaywall_location")
+    performs_io = True
 
-    def __init__(self, unpaywall_client: UnpaywallClient) -> None:
+    def __init__(self, unpaywall_client: UnpaywallClient, *, cache_size: int = _RECORD_CACHE_SIZE) -> None:
         self.unpaywall_client = unpaywall_client
+        self._cache_size = cache_size
+        # Futures rather than records so concurrent callers for one DOI share a single request.
+        self._records: OrderedDict[str, Future[Optional[UnpaywallRecord]]] = OrderedDict()
+        self._records_lock = threading.Lock()
 
     def resolve(self, paper: Paper) -> List[FullTextCandidate]:
+        try:
+            return self.resolve_or_raise(paper)
+        except _LookupFailed:
+            return []
+
+    def resolve_or_raise(self, paper: Paper) -> List[FullTextCandidate]:
+        """Like :meth:`resolve`, but raise ``_LookupFailed`` when Unpaywall could not be reached."""
+
         doi = (paper.doi or "").strip()
         if not doi:
             return []
         try:
-            record = self.unpaywall_client.get_record(doi)
-        except ClientError:
-            return []
+            record = self._fetch_record(doi)
+        except ClientError as exc:
+            raise _LookupFailed(doi) from exc
+        return self.candidates_for_record(record)
+
+    def fetch_records(
+        self, dois: Sequence[str], *, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> Dict[str, Optional[UnpaywallRecord]]:
+        """Fetch records for the distinct non-empty ``dois`` with bounded concurrency.
+
+        DOIs whose lookup failed with a transient upstream error are left out of
+        the result, so callers can tell them apart from DOIs without a record.
+        """
+
+        unique_dois = list(dict.fromkeys(doi for doi in dois if doi))
+        if not unique_dois:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(unique_dois))) as executor:
+            outcomes = list(executor.map(self._try_fetch_record, unique_dois))
+        return {doi: record for doi, (record, fetched) in zip(unique_dois, outcomes) if fetched}
+
+    def candidates_for_record(self, record: Optional[UnpaywallRecord]) -> List[FullTextCandidate]:
         if not record:
             return []
 
@@ -98,6 +143,46 @@ class UnpaywallResolver:
             return []
         return self._candidates_with_best(locations[0], locations[1:])
 
+    def _fetch_record(self, doi: str) -> Optional[UnpaywallRecord]:
+        key = doi.strip().lower()
+        if key.startswith(_UNPAYWALL_SKIP_PREFIXES):
+            return None
+        with self._records_lock:
+            future = self._records.get(key)
+            owner = future is None
+            if future is None:
+                future = self._records[key] = Future()
+                if len(self._records) > self._cache_size:
+                    self._records.popitem(last=False)
+            else:
+                self._records.move_to_end(key)
+
+        if owner:
+            try:
+                future.set_result(self.unpaywall_client.get_record(doi))
+            except Exception as exc:
+                # Failures, transient ones included, are raised to every waiter but not remembered.
+                self._forget(key, future)
+                future.set_exception(exc)
+            except BaseException:
+                # Interrupts stay with the owner; waiters see a transient lookup failure instead of
+                # blocking on a future that would never resolve.
+                self._forget(key, future)
+                future.set_exception(ClientError(f"Unpaywall lookup for {doi} was interrupted"))
+                raise
+        return future.result()
+
+    def _try_fetch_record(self, doi: str) -> Tuple[Optional[UnpaywallRecord], bool]:
+        try:
+            return self._fetch_record(doi), True
+        except ClientError:
+            return None, False
+
+    def _forget(self, key: str, future: Future[Optional[UnpaywallRecord]]) -> None:
+        with self._records_lock:
+            if self._records.get(key) is future:
+                del self._records[key]
+
     def _candidates_with_best(
         self,
         best_location: OpenAccessLocation,
@@ -108,7 +193,7 @@ class UnpaywallResolver:
         if best_candidate:
             candidates.append(best_candidate)
         for location in locations:
-            if location == best_location:
+            if location is best_location or location == best_location:
                 continue
             candidate = self._to_candidate(location, self.name_location)
             if candidate:
@@ -131,29 +216,192 @@ class UnpaywallResolver:
         )
 
 
+# Exact types only: a subclass may override ``resolve`` and read other Paper fields.
+_BUILTIN_RESOLVER_TYPES: frozenset[type] = frozenset(
+    {UpstreamFieldsResolver, ArxivDeterministicResolver, UnpaywallResolver}
+)
+
+_UNPAYWALL_SOURCES: frozenset[str] = frozenset({UnpaywallResolver.name_best, UnpaywallResolver.name_location})
+
+_SOURCE_RANK: Dict[str, int] = {
+    UnpaywallResolver.name_best: 0,
+    UnpaywallResolver.name_location: 1,
+    UpstreamFieldsResolver.name: 2,
+    ArxivDeterministicResolver.name: 3,
+}
+_SOURCE_RANK_FALLBACK = len(_SOURCE_RANK)
+
+
+def _candidate_sort_key(candidate: FullTextCandidate) -> tuple[int, str, str]:
+    return (
+        _SOURCE_RANK.get(candidate.source, _SOURCE_RANK_FALLBACK),
+        candidate.source,
+        candidate.pdf_url,
+    )
+
+
 class FullTextResolverService:
     def __init__(
         self,
         resolvers: Optional[Sequence[FullTextResolver]] = None,
         *,
         unpaywall_client: Optional[UnpaywallClient] = None,
+        cache_size: int = _RESOLUTION_CACHE_SIZE,
     ) -> None:
         self.resolvers = (
             list(resolvers)
             if resolvers is not None
             else self._default_resolvers(unpaywall_client=unpaywall_client)
         )
+        self._resolve_fns: Tuple[Callable[[Paper], List[FullTextCandidate]], ...] = tuple(
+            resolver.resolve_or_raise if isinstance(resolver, UnpaywallResolver) else resolver.resolve
+            for resolver in self.resolvers
+        )
+        self._cache_size = cache_size
+        self._builtin_resolvers_only = all(type(resolver) in _BUILTIN_RESOLVER_TYPES for resolver in self.resolvers)
+        self._resolution_cache: OrderedDict[_ResolutionKey, FullTextResolution] = OrderedDict()
+        self._resolution_cache_lock = threading.Lock()
+        # Local resolvers are cheap; only fan out when one of them waits on the network.
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if len(self.resolvers) > 1 and any(
+            getattr(resolver, "performs_io", False) for resolver in self.resolvers
+        ):
+            self._executor = ThreadPoolExecutor(max_workers=len(self.resolvers))
+
+    def close(self) -> None:
+        """Release the worker threads used to run resolvers concurrently."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
 
     def resolve(self, paper: Paper) -> FullTextResolution:
-        candidates: List[FullTextCandidate] = []
-        for resolver in self.resolvers:
-            candidates.extend(resolver.resolve(paper))
-        ordered = self._order_candidates(candidates)
+        key = self._cache_key(paper)
+        cached = self._cached_resolution(key)
+        if cached is not None:
+            return cached
+
+        if self._executor is None:
+            outcomes = [self._run_resolver(resolve, paper) for resolve in self._resolve_fns]
+        else:
+            futures = [self._executor.submit(self._run_resolver, resolve, paper) for resolve in self._resolve_fns]
+            outcomes = [future.result() for future in futures]
+        candidates = list(chain.from_iterable(found for found, _ in outcomes))
+        resolution = self._build_resolution(paper, candidates)
+        # A resolution missing a failed lookup's candidates is returned but not cached.
+        if all(complete for _, complete in outcomes):
+            self._store_resolution(key, resolution)
+        return resolution
+
+    def resolve_many(
+        self, papers: Sequence[Paper], *, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[FullTextResolution]:
+        """Resolve several papers, prefetching Unpaywall records for all DOIs up front.
+
+        Results are returned in input order. Network lookups are shared between
+        papers with the same DOI and issued concurrently; the remaining resolvers
+        run per paper as in :meth:`resolve`.
+        """
+
+        keys = [self._cache_key(paper) for paper in papers]
+        resolutions: List[Optional[FullTextResolution]] = [self._cached_resolution(key) for key in keys]
+        pending = [index for index, resolution in enumerate(resolutions) if resolution is None]
+
+        dois = {index: (papers[index].doi or "").strip() for index in pending}
+        prefetched: Dict[int, Dict[str, Optional[UnpaywallRecord]]] = {
+            id(resolver): resolver.fetch_records(list(dois.values()), max_concurrency=max_concurrency)
+            for resolver in self.resolvers
+            if isinstance(resolver, UnpaywallResolver)
+        }
+
+        # Candidates of the whole batch are deduped and ordered together, tagged by paper index.
+        unique: Dict[tuple[int, str, str], FullTextCandidate] = {}
+        incomplete: set[int] = set()
+        for index in pending:
+            paper, doi = papers[index], dois[index]
+            for resolver in self.resolvers:
+                if isinstance(resolver, UnpaywallResolver):
+                    records = prefetched[id(resolver)]
+                    if doi and doi not in records:
+                        # The lookup failed; leave this paper uncached so it is retried next time.
+                        incomplete.add(index)
+                        continue
+                    found = resolver.candidates_for_record(records[doi]) if doi else []
+                else:
+                    found = resolver.resolve(paper)
+                for candidate in found:
+                    unique.setdefault((index, candidate.source, candidate.pdf_url), candidate)
+
+        ordered: Dict[int, List[FullTextCandidate]] = {index: [] for index in pending}
+        for (index, _, _), candidate in sorted(
+            unique.items(), key=lambda item: (item[0][0], _candidate_sort_key(item[1]))
+        ):
+            ordered[index].append(candidate)
+
+        for index in pending:
+            paper = papers[index]
+            resolution = FullTextResolution(
+                candidates=ordered[index], oa_signal=self._resolve_oa_signal(paper, ordered[index])
+            )
+            if index not in incomplete:
+                self._store_resolution(keys[index], resolution)
+            resolutions[index] = resolution
+        return cast(List[FullTextResolution], resolutions)
+
+    def invalidate(self, paper: Paper) -> None:
+        """Drop any cached resolution for ``paper`` so the next call re-resolves it."""
+
+        with self._resolution_cache_lock:
+            self._resolution_cache.pop(self._cache_key(paper), None)
+
+    def apply(self, paper: Paper) -> Paper:
+        return self._apply_resolution(paper, self.resolve(paper))
+
+    def apply_many(
+        self, papers: Sequence[Paper], *, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[Paper]:
+        resolutions = self.resolve_many(papers, max_concurrency=max_concurrency)
+        return [self._apply_resolution(paper, resolution) for paper, resolution in zip(papers, resolutions)]
+
+    @staticmethod
+    def _run_resolver(
+        resolve: Callable[[Paper], List[FullTextCandidate]], paper: Paper
+    ) -> Tuple[List[FullTextCandidate], bool]:
+        """Run one resolver, returning its candidates and whether its lookup completed."""
+
+        try:
+            return resolve(paper), True
+        except _LookupFailed:
+            return [], False
+
+    def _cache_key(self, paper: Paper) -> _ResolutionKey:
+        if self._builtin_resolvers_only:
+            return (paper.doi or "", paper.pdf_url or "", paper.url or "", paper.is_oa)
+        values = (getattr(paper, field.name) for field in fields(paper))
+        return tuple(tuple(value) if isinstance(value, list) else value for value in values)
+
+    def _cached_resolution(self, key: _ResolutionKey) -> Optional[FullTextResolution]:
+        with self._resolution_cache_lock:
+            resolution = self._resolution_cache.get(key)
+            if resolution is not None:
+                self._resolution_cache.move_to_end(key)
+            return resolution
+
+    def _store_resolution(self, key: _ResolutionKey, resolution: FullTextResolution) -> None:
+        if self._cache_size <= 0:
+            return
+        with self._resolution_cache_lock:
+            self._resolution_cache[key] = resolution
+            self._resolution_cache.move_to_end(key)
+            if len(self._resolution_cache) > self._cache_size:
+                self._resolution_cache.popitem(last=False)
+
+    def _build_resolution(self, paper: Paper, candidates: List[FullTextCandidate]) -> FullTextResolution:
+        ordered = candidates if len(candidates) < 2 else self._order_candidates(candidates)
         oa_signal = self._resolve_oa_signal(paper, ordered)
         return FullTextResolution(candidates=ordered, oa_signal=oa_signal)
 
-    def apply(self, paper: Paper) -> Paper:
-        resolution = self.resolve(paper)
+    @staticmethod
+    def _apply_resolution(paper: Paper, resolution: FullTextResolution) -> Paper:
         best = resolution.best
         if best and best.pdf_url:
             paper.resolved_pdf_url = best.pdf_url
@@ -167,39 +415,17 @@ class FullTextResolverService:
     ) -> Optional[bool]:
         if paper.is_oa is True:
             return True
-        if any(candidate.source in cls._unpaywall_sources() for candidate in candidates):
+        if not _UNPAYWALL_SOURCES.isdisjoint(candidate.source for candidate in candidates):
             return True
         return None
 
-    @staticmethod
-    def _unpaywall_sources() -> set[str]:
-        return {UnpaywallResolver.name_best, UnpaywallResolver.name_location}
-
     @staticmethod
     def _order_candidates(candidates: List[FullTextCandidate]) -> List[FullTextCandidate]:
-        source_rank = {
-            UnpaywallResolver.name_best: 0,
-            UnpaywallResolver.name_location: 1,
-            UpstreamFieldsResolver.name: 2,
-            ArxivDeterministicResolver.name: 3,
-        }
-        ordered = sorted(
-            candidates,
-            key=lambda candidate: (
-                source_rank.get(candidate.source, len(source_rank)),
-                candidate.source,
-                candidate.pdf_url,
-            ),
-        )
-        seen: set[tuple[str, str]] = set()
-        deduped: List[FullTextCandidate] = []
-        for candidate in ordered:
-            key = (candidate.source, candidate.pdf_url)
-            if key in seen:
-                continue
-            seen.add(key)
-            deduped.append(candidate)
-        return deduped
+        # The sort is stable, so keeping the first occurrence before sorting matches dedupe-after-sort.
+        unique: Dict[tuple[str, str], FullTextCandidate] = {}
+        for candidate in candidates:
+            unique.setdefault((candidate.source, candidate.pdf_url), candidate)
+        return sorted(unique.values(), key=_candidate_sort_key)
 
     @staticmethod
     def _default_resolvers(
@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
+import importlib
 from dataclasses import dataclass
-from typing import Any, List, Sequence
+from functools import lru_cache
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, List, Sequence
+
+if TYPE_CHECKING:  # pragma: no cover
+    from lxml.etree import XPath
 
 TEI_NS = {"tei": "http://www.tei-c.org/ns/1.0"}
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperSection:
     title: str
     paragraphs: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperDocument:
     paper_id: str
     title: str
@@ -23,7 +29,7 @@ class PaperDocument:
     references: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperChunk:
     """A single chunk produced from the linear chunk stream of a TEI document.
 
@@ -138,29 +144,27 @@ class PaperChunkerService:
 
     def _parse_document(self) -> PaperDocument:
         root = self._etree.fromstring(self.tei_xml.encode())
+        # Bind one evaluator to the document so namespace setup is done once
+        # for all root-level queries.
+        evaluate = self._etree.XPathEvaluator(root, namespaces=TEI_NS, smart_strings=False)
+        node_text = self._node_text
 
-        title_nodes = root.xpath(".//tei:titleStmt/tei:title", namespaces=TEI_NS)
-        title = self._node_text(title_nodes[0]) if title_nodes else ""
+        title_nodes = evaluate(".//tei:titleStmt/tei:title")
+        title = node_text(title_nodes[0]) if title_nodes else ""
 
-        abstract_nodes = root.xpath(".//tei:abstract/tei:p", namespaces=TEI_NS)
-        abstract = [self._node_text(node) for node in abstract_nodes if self._node_text(node)]
+        abstract = [text for text in map(node_text, evaluate(".//tei:abstract/tei:p")) if text]
 
-        section_nodes = root.xpath(".//tei:text/tei:body/tei:div", namespaces=TEI_NS)
+        section_heads = _tei_xpath("./tei:head")
+        section_paragraphs = _tei_xpath("./tei:p")
         sections: List[PaperSection] = []
-        for section_node in section_nodes:
-            head_nodes = section_node.xpath("./tei:head", namespaces=TEI_NS)
-            section_title = self._node_text(head_nodes[0]) if head_nodes else "Untitled"
-            paragraph_nodes = section_node.xpath("./tei:p", namespaces=TEI_NS)
-            paragraphs = [
-                self._node_text(paragraph)
-                for paragraph in paragraph_nodes
-                if self._node_text(paragraph)
-            ]
+        for section_node in evaluate(".//tei:text/tei:body/tei:div"):
+            head_nodes = section_heads(section_node)
+            section_title = node_text(head_nodes[0]) if head_nodes else "Untitled"
+            paragraphs = [text for text in map(node_text, section_paragraphs(section_node)) if text]
             if paragraphs:
                 sections.append(PaperSection(title=section_title, paragraphs=paragraphs))
 
-        reference_nodes = root.xpath(".//tei:listBibl//tei:title", namespaces=TEI_NS)
-        references = [self._node_text(node) for node in reference_nodes if self._node_text(node)]
+        references = [text for text in map(node_text, evaluate(".//tei:listBibl//tei:title")) if text]
 
         return PaperDocument(
             paper_id=self.paper_id,
@@ -228,15 +232,22 @@ class PaperChunkerService:
             return _WhitespaceEncoding()
 
 
-def _load_lxml():
+def _load_lxml() -> ModuleType:
     try:
-        from lxml import etree
+        return importlib.import_module("lxml.etree")
     except ImportError as exc:  # pragma: no cover - optional dependency
         raise ImportError(
             "GROBID chunking requires the optional dependency 'lxml'. "
             "Install it with `pip install lxml`."
         ) from exc
-    return etree
+
+
+@lru_cache(maxsize=None)
+def _tei_xpath(expression: str) -> XPath:
+    """Compile a TEI-namespaced XPath once; results are plain ``str``/elements."""
+
+    xpath: XPath = _load_lxml().XPath(expression, namespaces=TEI_NS, smart_strings=False)
+    return xpath
 
 
 def _load_tiktoken():
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional, Sequence
 
 from literature_retrieval_engine.core.models import Paper
 from literature_retrieval_engine.services.full_text_resolver_service import FullTextResolverService
@@ -19,3 +19,11 @@ class PaperEnrichmentService:
             return paper
 
         return self.resolver.apply(paper)
+
+    def enrich_many(self, papers: Sequence[Paper]) -> List[Paper]:
+        """Enrich several papers, batching the open-access lookups."""
+
+        if not self.resolver:
+            return list(papers)
+
+        return self.resolver.apply_many(papers)
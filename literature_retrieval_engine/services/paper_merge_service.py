@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Sequence, Tuple
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from literature_retrieval_engine.core.identifiers import normalize_doi
 from literature_retrieval_engine.core.models import Paper
@@ -9,6 +10,60 @@ DEFAULT_SOURCE_PRIORITY = ("crossref", "datacite", "openalex", "semanticscholar"
 
 PrioritySpec = Sequence[str | Sequence[str]]
 PriorityGroups = Tuple[Tuple[str, ...], ...]
+# Source -> priority index, plus the rank given to sources outside every group.
+RankTable = Tuple[Dict[str, int], int]
+
+# Fields where the aggregators' records are usually richer than the registries'.
+_AGGREGATOR_FIRST_FIELDS = frozenset({"abstract", "authors"})
+
+Predicate = Callable[[Any], bool]
+TieBreaker = Callable[[Any, Any], bool]
+# (field name, field getter, predicate, source ranks, unranked fallback, tie breaker)
+FieldSpec = Tuple[str, Callable[[Paper], Any], Predicate, Dict[str, int], int, Optional[TieBreaker]]
+
+
+def _is_non_empty(value: Any) -> bool:
+    if value is None:
+        return False
+    if isinstance(value, str):
+        return bool(value.strip())
+    return True
+
+
+def _is_not_none(value: Any) -> bool:
+    return value is not None
+
+
+def _has_authors(value: Any) -> bool:
+    return bool(value)
+
+
+def _prefer_longer_text(current: Any, candidate: Any) -> bool:
+    if current is None:
+        return True
+    if candidate is None:
+        return False
+    return len(str(candidate)) > len(str(current))
+
+
+def _prefer_more_authors(current: Any, candidate: Any) -> bool:
+    current_len = len(current or [])
+    candidate_len = len(candidate or [])
+    return candidate_len > current_len
+
+
+# The DOI is selected separately from the normalized values computed in merge().
+_FIELD_RULES: Tuple[Tuple[str, Predicate, Optional[TieBreaker]], ...] = (
+    ("paper_id", _is_non_empty, None),
+    ("title", _is_non_empty, None),
+    ("abstract", _is_non_empty, _prefer_longer_text),
+    ("year", _is_not_none, None),
+    ("venue", _is_non_empty, None),
+    ("url", _is_non_empty, None),
+    ("pdf_url", _is_non_empty, None),
+    ("is_oa", _is_not_none, None),
+    ("authors", _has_authors, _prefer_more_authors),
+)
 
 
 class PaperMergeService:
@@ -22,169 +77,119 @@ class PaperMergeService:
         for idx, group in enumerate(self.priority_groups):
             for source in group:
                 self.source_priority[source] = idx
+        default_ranks: RankTable = (self.source_priority, len(self.priority_groups))
+        aggregator_ranks = self._build_rank_table(
+            self._normalize_priority_spec((("openalex", "semanticscholar"), *self.priority_groups))
+        )
+        field_specs: List[FieldSpec] = []
+        for field_name, predicate, tie_breaker in _FIELD_RULES:
+            ranks, unranked = aggregator_ranks if field_name in _AGGREGATOR_FIRST_FIELDS else default_ranks
+            field_specs.append(
+                (field_name, attrgetter(field_name), predicate, ranks, unranked, tie_breaker)
+            )
+        self._field_specs: Tuple[FieldSpec, ...] = tuple(field_specs)
 
     def merge(self, papers: List[Paper]) -> Paper:
         if not papers:
             raise ValueError("Cannot merge an empty collection of papers")
 
-        primary_index = self._primary_source_index(papers)
-        doi_value = self._select_field(
-            papers,
-            "doi",
-            self._is_non_empty,
-            priority_order=self.priority_groups,
-            transform=normalize_doi,
-        )
-
-        paper_id_value = self._select_field(
-            papers,
-            "paper_id",
-            self._is_non_empty,
-            preferred_value=doi_value,
-            priority_order=self.priority_groups,
-        )
-
-        title_value = self._select_field(
-            papers,
-            "title",
-            self._is_non_empty,
-            priority_order=self.priority_groups,
-        )
-        abstract_value = self._select_field(
-            papers,
-            "abstract",
-            self._is_non_empty,
-            priority_order=self._normalize_priority_spec(
-                (("openalex", "semanticscholar"), *self.priority_groups)
-            ),
-            tie_breaker=self._prefer_longer_text,
-        )
-        year_value = self._select_field(
-            papers,
-            "year",
-            self._is_not_none,
-            priority_order=self.priority_groups,
-        )
-        venue_value = self._select_field(
-            papers,
-            "venue",
-            self._is_non_empty,
-            priority_order=self.priority_groups,
-        )
-        url_value = self._select_field(
-            papers,
-            "url",
-            self._is_non_empty,
-            priority_order=self.priority_groups,
-        )
-        pdf_url_value = self._select_field(
-            papers,
-            "pdf_url",
-            self._is_non_empty,
-            priority_order=self.priority_groups,
-        )
-        is_oa_value = self._select_field(
-            papers, "is_oa", self._is_not_none, priority_order=self.priority_groups
-        )
-        authors_value = self._select_field(
-            papers,
-            "authors",
-            self._has_authors,
-            priority_order=self._normalize_priority_spec(
-                (("openalex", "semanticscholar"), *self.priority_groups)
-            ),
-            tie_breaker=self._prefer_more_authors,
-        )
+        # DOIs drive both the primary record and the merged DOI, so normalize each once.
+        normalized_dois = [normalize_doi(paper.doi) for paper in papers]
+        primary_index = self._primary_source_index(papers, normalized_dois)
+        doi_value = self._select_doi(papers, normalized_dois)
+        selected = self._select_fields(papers)
+        paper_id_value = selected.get("paper_id")
+        # A record whose own identifier is the merged DOI wins the paper_id outright.
+        if doi_value is not None and any(paper.paper_id == doi_value for paper in papers):
+            paper_id_value = doi_value
 
         primary_source = papers[primary_index].source
 
         return Paper(
             paper_id=paper_id_value or doi_value or papers[primary_index].paper_id,
-            title=title_value or "",
+            title=selected.get("title") or "",
             doi=doi_value,
-            abstract=abstract_value,
-            year=year_value,
-            venue=venue_value,
+            abstract=selected.get("abstract"),
+            year=selected.get("year"),
+            venue=selected.get("venue"),
             source=primary_source,
-            url=url_value,
-            pdf_url=pdf_url_value,
-            is_oa=is_oa_value,
-            authors=authors_value or [],
+            url=selected.get("url"),
+            pdf_url=selected.get("pdf_url"),
+            is_oa=selected.get("is_oa"),
+            authors=selected.get("authors") or [],
         )
 
-    def _rank_key(self, paper: Paper, position: int) -> Tuple[int, int, int]:
-        doi_rank = 0 if normalize_doi(paper.doi) else 1
-        source_rank = self._source_rank(paper.source, self.priority_groups)
-        return (doi_rank, source_rank, position)
+    def merge_many(self, groups: Iterable[List[Paper]]) -> List[Paper]:
+        """Merge each group of duplicate records, returning results in group order."""
 
-    def _source_rank(self, source: str, priority_order: PrioritySpec) -> int:
-        for idx, entry in enumerate(priority_order):
-            if isinstance(entry, (list, tuple, set)):
-                if source in entry:
-                    return idx
-            elif source == entry:
-                return idx
-        return len(priority_order)
-
-    def _primary_source_index(self, papers: Sequence[Paper]) -> int:
-        ranked = list(enumerate(papers))
-        ranked.sort(key=lambda pair: self._rank_key(pair[1], pair[0]))
-        return ranked[0][0]
-
-    def _select_field(
-        self,
-        papers: Sequence[Paper],
-        field_name: str,
-        predicate,
-        *,
-        preferred_value: Any | None = None,
-        priority_order: PrioritySpec | None = None,
-        tie_breaker=None,
-        transform=None,
-    ) -> Any:
-        selected_value: Any | None = None
-        selected_rank: int | None = None
-        selected_position: int | None = None
-
-        priorities = priority_order or self.priority_groups
-
-        for position, paper in enumerate(papers):
-            raw_value = getattr(paper, field_name)
-            value = transform(raw_value) if transform else raw_value
-
-            if preferred_value is not None and value == preferred_value and predicate(value):
-                return value
-
-            if not predicate(value):
-                continue
+        merge = self.merge
+        return [merge(group) for group in groups]
 
-            rank = self._source_rank(paper.source, priorities)
-            if selected_rank is None:
-                selected_value = value
-                selected_rank = rank
-                selected_position = position
-                continue
+    def _rank_key(self, paper: Paper, position: int, normalized_doi: Optional[str]) -> Tuple[int, int, int]:
+        doi_rank = 0 if normalized_doi else 1
+        source_rank = self.source_priority.get(paper.source, len(self.priority_groups))
+        return (doi_rank, source_rank, position)
 
-            better_candidate = False
-            if rank < selected_rank:  # type: ignore[operator]
-                better_candidate = True
-            elif rank == selected_rank:
-                if tie_breaker:
-                    tie_decision = tie_breaker(selected_value, value)
-                    if tie_decision is True:
-                        better_candidate = True
-                    elif tie_decision is False:
-                        better_candidate = False
-                    else:
-                        better_candidate = position < (selected_position or 0)
-                else:
-                    better_candidate = position < (selected_position or 0)
-
-            if better_candidate:
-                selected_value = value
-                selected_rank = rank
-                selected_position = position
-        return selected_value
+    @staticmethod
+    def _build_rank_table(groups: PriorityGroups) -> RankTable:
+        return {source: idx for idx, group in enumerate(groups) for source in group}, len(groups)
+
+    def _primary_source_index(self, papers: Sequence[Paper], normalized_dois: Sequence[Optional[str]]) -> int:
+        return min(range(len(papers)), key=lambda index: self._rank_key(papers[index], index, normalized_dois[index]))
+
+    def _select_doi(self, papers: Sequence[Paper], normalized_dois: Sequence[Optional[str]]) -> Optional[str]:
+        unranked = len(self.priority_groups)
+        selected: Optional[str] = None
+        selected_rank = unranked
+        for paper, doi in zip(papers, normalized_dois):
+            if not doi:
+                continue
+            rank = self.source_priority.get(paper.source, unranked)
+            if selected is None or rank < selected_rank:
+                selected, selected_rank = doi, rank
+                if rank == 0:
+                    break
+        return selected
+
+    def _select_fields(self, papers: Sequence[Paper]) -> Dict[str, Any]:
+        """Pick every merged field's value in one pass over ``papers``.
+
+        A candidate replaces the current pick when its source ranks strictly
+        higher, or on equal rank when the field's tie breaker prefers it;
+        otherwise the earliest record wins. A field without a tie breaker is
+        settled by its first top-rank value and drops out of the scan.
+        """
+
+        values: Dict[str, Any] = {}
+        selected_ranks: Dict[str, int] = {}
+        active = self._field_specs
+
+        for paper in papers:
+            source = paper.source
+            settled = False
+            for field_name, get_value, predicate, ranks, unranked, tie_breaker in active:
+                value = get_value(paper)
+                if not predicate(value):
+                    continue
+
+                rank = ranks.get(source, unranked)
+                selected_rank = selected_ranks.get(field_name)
+                if (
+                    selected_rank is None
+                    or rank < selected_rank
+                    or (rank == selected_rank and tie_breaker is not None and tie_breaker(values[field_name], value))
+                ):
+                    values[field_name] = value
+                    selected_ranks[field_name] = rank
+                    settled = settled or (rank == 0 and tie_breaker is None)
+
+            if settled:
+                active = tuple(
+                    spec for spec in active if spec[5] is not None or selected_ranks.get(spec[0]) != 0
+                )
+                if not active:
+                    break
+        return values
 
     @staticmethod
     def _normalize_priority_spec(
@@ -205,38 +210,11 @@ class PaperMergeService:
 
         return tuple(normalized)
 
-    @staticmethod
-    def _is_non_empty(value: Any) -> bool:
-        if value is None:
-            return False
-        if isinstance(value, str):
-            return bool(value.strip())
-        return True
-
-    @staticmethod
-    def _is_not_none(value: Any) -> bool:
-        return value is not None
 
-    @staticmethod
-    def _has_authors(value: Any) -> bool:
-        return bool(value)
-
-    @staticmethod
-    def _prefer_longer_text(current: Any, candidate: Any) -> bool:
-        if current is None:
-            return True
-        if candidate is None:
-            return False
-        return len(str(candidate)) > len(str(current))
-
-    @staticmethod
-    def _prefer_more_authors(current: Any, candidate: Any) -> bool:
-        current_len = len(current or [])
-        candidate_len = len(candidate or [])
-        return candidate_len > current_len
+_DEFAULT_SERVICE = PaperMergeService()
 
 
 def merge_papers(papers: List[Paper]) -> Paper:
     """Convenience wrapper for merging without instantiating the service."""
 
-    return PaperMergeService().merge(papers)
+    return _DEFAULT_SERVICE.merge(papers)
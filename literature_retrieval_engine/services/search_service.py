@@ -2,7 +2,13 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
 
 from literature_retrieval_engine.core.identifiers import normalize_doi, normalize_title
 from literature_retrieval_engine.core.models import Paper
@@ -25,6 +31,96 @@ from .doi_resolver_service import DoiResolverService
 
 logger = logging.getLogger(__name__)
 
+# Enough workers for every search pass or per-provider DOI lookup to run at once.
+_UPSTREAM_WORKERS = 4
+
+_TITLE_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+_CANONICAL_CACHE_SIZE = 2048
+_SEARCH_CACHE_SIZE = 256
+_SEARCH_CACHE_TTL_SECONDS = 300.0
+
+# (query, k, min_year, max_year, include_raw)
+_SearchKey = Tuple[str, int, Optional[int], Optional[int], bool]
+# (expiry on the monotonic clock, merged results, raw results)
+_SearchEntry = Tuple[float, List[Paper], List[Paper]]
+
+# Registration agency of some high-volume DOI prefixes. A DOI is registered with exactly one
+# agency, so a lookup in the other registry is a guaranteed miss and can be skipped. Unknown
+# prefixes are looked up in both registries.
+_DOI_PREFIX_REGISTRARS: Dict[str, str] = {
+    **dict.fromkeys(
+        (
+            "10.1002",  # Wiley
+            "10.1007",  # Springer
+            "10.1016",  # Elsevier
+            "10.1021",  # ACS
+            "10.1038",  # Nature
+            "10.1073",  # PNAS
+            "10.1093",  # Oxford University Press
+            "10.1101",  # bioRxiv / medRxiv
+            "10.1103",  # APS
+            "10.1109",  # IEEE
+            "10.1126",  # Science
+            "10.1145",  # ACM
+            "10.1371",  # PLOS
+            "10.18653",  # ACL Anthology
+            "10.3390",  # MDPI
+        ),
+        "crossref",
+    ),
+    **dict.fromkeys(
+        (
+            "10.48550",  # arXiv
+            "10.5061",  # Dryad
+            "10.5281",  # Zenodo
+            "10.6084",  # figshare
+            "10.7910",  # Harvard Dataverse
+            "10.17605",  # OSF
+        ),
+        "datacite",
+    ),
+}
+
+# Soft-grouping candidates bucketed by title prefix: prefix -> [(group key, representative token set)].
+PrefixIndex = Dict[str, List[Tuple[str, FrozenSet[str]]]]
+
+
+@lru_cache(maxsize=4096)
+def _title_tokens(title: str) -> Tuple[str, Tuple[str, ...]]:
+    """Return the normalized ``title`` and its word tokens.
+
+    Grouping keys and soft matching look at the same titles over and over, so
+    the normalization is cached rather than redone per comparison.
+    """
+
+    normalized_title = normalize_title(title)
+    if not normalized_title:
+        return normalized_title, ()
+    return normalized_title, tuple(_TITLE_TOKEN_RE.findall(normalized_title))
+
+
+@lru_cache(maxsize=4096)
+def _title_token_set(title: str) -> FrozenSet[str]:
+    """Return the tokens of ``title`` as a set, built once per distinct title."""
+
+    return frozenset(_title_tokens(title)[1])
+
+
+def _copy_paper(paper: Paper) -> Paper:
+    """Copy ``paper`` without sharing its mutable ``authors`` list."""
+
+    return replace(paper, authors=list(paper.authors))
+
+
+def _doi_registrar(doi: str) -> Optional[str]:
+    """Return ``"crossref"`` or ``"datacite"`` when the DOI's prefix is known, else ``None``."""
+
+    normalized_doi = normalize_doi(doi)
+    if not normalized_doi:
+        return None
+    return _DOI_PREFIX_REGISTRARS.get(normalized_doi.split("/", 1)[0])
+
 
 class PaperSearchService:
     """Aggregate paper search across OpenAlex and Semantic Scholar.
@@ -38,6 +134,12 @@ class PaperSearchService:
     intentionally conservative to avoid collapsing distinct short titles: the
     Jaccard threshold is never lower than 0.82 and only the first six tokens are
     compared when looking for a match.
+
+    Search results are cached per query and filter set for ``search_cache_ttl``
+    seconds (300 by default), so repeating a search inside that window does not
+    see upstream changes. Pass ``use_cache=False`` to force a fresh search, call
+    :meth:`clear_cache`, or construct the service with ``search_cache_ttl=0`` to
+    disable the cache.
     """
 
     def __init__(
@@ -55,6 +157,8 @@ class PaperSearchService:
         candidate_multiplier: int = 5,
         enable_openalex_no_stem_pass: bool = True,
         enable_semanticscholar_hyphen_pass: bool = True,
+        cache_size: int = _CANONICAL_CACHE_SIZE,
+        search_cache_ttl: float = _SEARCH_CACHE_TTL_SECONDS,
     ) -> None:
         self.openalex = openalex or OpenAlexClient()
         self.semanticscholar = semanticscholar or SemanticScholarClient()
@@ -70,6 +174,13 @@ class PaperSearchService:
         self.candidate_multiplier = max(1, candidate_multiplier)
         self.enable_openalex_no_stem_pass = enable_openalex_no_stem_pass
         self.enable_semanticscholar_hyphen_pass = enable_semanticscholar_hyphen_pass
+        self._executor = ThreadPoolExecutor(max_workers=_UPSTREAM_WORKERS)
+        self._cache_size = cache_size
+        self._search_cache_ttl = search_cache_ttl
+        # Canonical records by normalized DOI (hits only) and recent search results.
+        self._canonical_cache: OrderedDict[str, Paper] = OrderedDict()
+        self._search_cache: OrderedDict[_SearchKey, _SearchEntry] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def search(
         self,
@@ -78,6 +189,7 @@ class PaperSearchService:
         k: int = 5,
         min_year: Optional[int] = None,
         max_year: Optional[int] = None,
+        use_cache: bool = True,
     ) -> List[Paper]:
         merged, _ = self.search_with_raw(
             query,
@@ -85,6 +197,7 @@ class PaperSearchService:
             min_year=min_year,
             max_year=max_year,
             include_raw=False,
+            use_cache=use_cache,
         )
         return merged
 
@@ -96,131 +209,158 @@ class PaperSearchService:
         min_year: Optional[int] = None,
         max_year: Optional[int] = None,
         include_raw: bool = True,
+        use_cache: bool = True,
     ) -> Tuple[List[Paper], List[Paper]]:
         if not query:
             return [], []
 
+        # ``use_cache=False`` skips the lookup but still refreshes the cached entry.
+        cache_key: _SearchKey = (query, k, min_year, max_year, include_raw)
+        cached = self._cached_search(cache_key) if use_cache else None
+        if cached is not None:
+            return cached
+
         per_pass = k * self.candidate_multiplier
 
         grouped: Dict[str, List[Paper]] = {}
-        order: List[str] = []
+        prefix_index: PrefixIndex = {}
 
         date_filters = self._build_openalex_filters(min_year=min_year, max_year=max_year)
         quoted_query = self._quote_phrase(query)
 
-        try:
-            openalex_works, _ = self.openalex.search_works(
-                quoted_query, per_page=per_pass, filters=date_filters or None
+        # The upstream passes are independent; run them concurrently and group in a fixed order.
+        passes: List[Future[List[Paper]]] = [
+            self._executor.submit(
+                self._search_openalex, "OpenAlex search", quoted_query, per_pass, date_filters or None
             )
-        except ClientError as exc:
-            logger.warning("OpenAlex search failed: %s", exc)
-            openalex_works = []
-        openalex_results = [openalex_work_to_paper(work) for work in openalex_works]
-        self._append_to_groups(openalex_results, grouped, order)
-
+        ]
         if self.enable_openalex_no_stem_pass:
             openalex_no_stem_filters = {
                 **date_filters,
                 "title_and_abstract.search.no_stem": quoted_query,
             }
-            try:
-                openalex_no_stem, _ = self.openalex.search_works(
-                    "", per_page=per_pass, filters=openalex_no_stem_filters
+            passes.append(
+                self._executor.submit(
+                    self._search_openalex, "OpenAlex no-stem search", "", per_pass, openalex_no_stem_filters
+                )
+            )
+        passes.append(
+            self._executor.submit(
+                self._search_semanticscholar, "Semantic Scholar search", quoted_query, per_pass, min_year, max_year
+            )
+        )
+        if self.enable_semanticscholar_hyphen_pass and "-" in query:
+            normalized_phrase = self._quote_phrase(self._normalize_hyphens(query))
+            passes.append(
+                self._executor.submit(
+                    self._search_semanticscholar,
+                    "Semantic Scholar normalized search",
+                    normalized_phrase,
+                    per_pass,
+                    min_year,
+                    max_year,
                 )
-            except ClientError as exc:
-                logger.warning("OpenAlex no-stem search failed: %s", exc)
-                openalex_no_stem = []
-            openalex_no_stem_results = [
-                openalex_work_to_paper(work) for work in openalex_no_stem
-            ]
-            self._append_to_groups(openalex_no_stem_results, grouped, order)
+            )
+
+        for search_pass in passes:
+            self._append_to_groups(search_pass.result(), grouped, prefix_index)
+
+        # Groups keep their creation order, which is the order results are merged and reported in.
+        merged_results = self.merge_service.merge_many(grouped.values())
+        raw_results = [paper for group in grouped.values() for paper in group] if include_raw else []
+        reranked_results = self._rerank_locally(merged_results, query=query)
+        max_upgrade_attempts = max(k * 2, 10)
+        doi_backed = self._select_top_k_doi_backed(
+            reranked_results,
+            query=query,
+            k=k,
+            max_upgrade_attempts=max_upgrade_attempts,
+        )
+        self._store_search(cache_key, doi_backed, raw_results)
+        return doi_backed, raw_results
+
+    def close(self) -> None:
+        """Release the worker threads used for the upstream search passes."""
+
+        self._executor.shutdown(wait=False)
+
+    def clear_cache(self) -> None:
+        """Forget cached search results and canonical DOI records."""
+
+        with self._cache_lock:
+            self._search_cache.clear()
+            self._canonical_cache.clear()
 
+    def _search_openalex(
+        self, description: str, query: str, per_page: int, filters: Optional[Dict[str, Any]]
+    ) -> List[Paper]:
+        try:
+            works, _ = self.openalex.search_works(query, per_page=per_page, filters=filters)
+        except ClientError as exc:
+            logger.warning("%s failed: %s", description, exc)
+            return []
+        return [openalex_work_to_paper(work) for work in works]
+
+    def _search_semanticscholar(
+        self,
+        description: str,
+        phrase: str,
+        limit: int,
+        min_year: Optional[int],
+        max_year: Optional[int],
+    ) -> List[Paper]:
         try:
             if hasattr(self.semanticscholar, "search_papers_advanced"):
-                semantic_records = self.semanticscholar.search_papers_advanced(
-                    quoted_query,
-                    limit=per_pass,
+                records = self.semanticscholar.search_papers_advanced(
+                    phrase,
+                    limit=limit,
                     min_year=min_year,
                     max_year=max_year,
                     fields=DEFAULT_FIELDS,
                 )
             else:
-                semantic_records = self.semanticscholar.search_papers(
-                    quoted_query,
-                    limit=per_pass,
+                records = self.semanticscholar.search_papers(
+                    phrase,
+                    limit=limit,
                     min_year=min_year,
                     max_year=max_year,
                     fields=DEFAULT_FIELDS,
                 )
         except ClientError as exc:
-            logger.warning("Semantic Scholar search failed: %s", exc)
-            semantic_records = []
-        semantic_results = [semanticscholar_paper_to_paper(record) for record in semantic_records]
-        self._append_to_groups(semantic_results, grouped, order)
+            logger.warning("%s failed: %s", description, exc)
+            return []
+        return [semanticscholar_paper_to_paper(record) for record in records]
 
-        normalized_query = query
-        if self.enable_semanticscholar_hyphen_pass and "-" in query:
-            normalized_query = self._normalize_hyphens(query)
-            normalized_phrase = self._quote_phrase(normalized_query)
-            try:
-                if hasattr(self.semanticscholar, "search_papers_advanced"):
-                    semantic_normalized = self.semanticscholar.search_papers_advanced(
-                        normalized_phrase,
-                        limit=per_pass,
-                        min_year=min_year,
-                        max_year=max_year,
-                        fields=DEFAULT_FIELDS,
-                    )
-                else:
-                    semantic_normalized = self.semanticscholar.search_papers(
-                        normalized_phrase,
-                        limit=per_pass,
-                        min_year=min_year,
-                        max_year=max_year,
-                        fields=DEFAULT_FIELDS,
-                    )
-            except ClientError as exc:
-                logger.warning("Semantic Scholar normalized search failed: %s", exc)
-                semantic_normalized = []
-            semantic_normalized_results = [
-                semanticscholar_paper_to_paper(record) for record in semantic_normalized
-            ]
-            self._append_to_groups(semantic_normalized_results, grouped, order)
-
-        merged_results = [self.merge_service.merge(grouped[key]) for key in order]
-        raw_results = [paper for key in order for paper in grouped[key]] if include_raw else []
-        reranked_results = self._rerank_locally(merged_results, query=query)
-        max_upgrade_attempts = max(k * 2, 10)
-        doi_backed = self._select_top_k_doi_backed(
-            reranked_results,
-            query=query,
-            k=k,
-            max_upgrade_attempts=max_upgrade_attempts,
+    def search_by_doi(self, doi: str) -> Optional[Paper]:
+        registrar = _doi_registrar(doi)
+        crossref_lookup = (
+            self._executor.submit(self.crossref.works_by_doi, doi) if registrar != "datacite" else None
         )
-        return doi_backed, raw_results
+        datacite_lookup = (
+            self._executor.submit(self.datacite.get_by_doi, doi) if registrar != "crossref" else None
+        )
+        openalex_lookup = self._executor.submit(self.openalex.get_work_by_doi, doi)
+        semantic_lookup = self._executor.submit(self.semanticscholar.get_by_doi, doi, fields=DEFAULT_FIELDS)
 
-    def search_by_doi(self, doi: str) -> Optional[Paper]:
-        candidates: List[Paper] = []
-        seen: Set[str] = set()
+        found: List[Paper] = []
 
-        crossref_work = self.crossref.works_by_doi(doi)
+        crossref_work = crossref_lookup.result() if crossref_lookup is not None else None
         if crossref_work:
-            self._append_unique([crossref_work_to_paper(crossref_work)], candidates, seen)
+            found.append(crossref_work_to_paper(crossref_work))
 
-        datacite_work = self.datacite.get_by_doi(doi)
+        datacite_work = datacite_lookup.result() if datacite_lookup is not None else None
         if datacite_work:
-            self._append_unique([datacite_work_to_paper(datacite_work)], candidates, seen)
+            found.append(datacite_work_to_paper(datacite_work))
 
-        openalex_work = self.openalex.get_work_by_doi(doi)
+        openalex_work = openalex_lookup.result()
         if openalex_work:
-            self._append_unique([openalex_work_to_paper(openalex_work)], candidates, seen)
+            found.append(openalex_work_to_paper(openalex_work))
 
-        semantic_record = self.semanticscholar.get_by_doi(doi, fields=DEFAULT_FIELDS)
+        semantic_record = semantic_lookup.result()
         if semantic_record:
-            self._append_unique(
-                [semanticscholar_paper_to_paper(semantic_record)], candidates, seen
-            )
+            found.append(semanticscholar_paper_to_paper(semantic_record))
 
+        candidates = self._dedupe_by_group_key(found)
         if not candidates:
             return None
 
@@ -313,29 +453,35 @@ class PaperSearchService:
     def _normalize_hyphens(self, query: str) -> str:
         return query.replace("-", " ")
 
-    def _upgrade_to_doi_backed(
-        self, paper: Paper, *, query_fallback_title: str
-    ) -> Optional[Paper]:
-        doi = normalize_doi(paper.doi)
-        if doi:
-            return paper
-
-        title = (paper.title or query_fallback_title or "").strip()
-        if not title:
-            return None
-
-        resolved_doi = self.doi_resolver.resolve_doi_from_title(
-            title,
-            expected_authors=paper.authors or None,
-        )
-        if not resolved_doi:
-            return None
-
-        canonical = self._fetch_canonical_by_doi(resolved_doi)
-        if canonical and normalize_doi(canonical.doi):
-            return canonical
+    def _upgrade_many_to_doi_backed(
+        self, papers: Sequence[Paper], *, query_fallback_title: str
+    ) -> List[Optional[Paper]]:
+        """Upgrade DOI-less papers to canonical DOI-backed records, one result per paper.
+
+        Titles are resolved to DOIs concurrently, then every resolved DOI is
+        fetched through one batched lookup per provider.
+        """
+
+        resolutions: List[Optional[Future[Optional[str]]]] = []
+        for paper in papers:
+            title = (paper.title or query_fallback_title or "").strip()
+            resolutions.append(
+                self._executor.submit(
+                    self.doi_resolver.resolve_doi_from_title,
+                    title,
+                    expected_authors=paper.authors or None,
+                )
+                if title
+                else None
+            )
+        resolved_dois = [resolution.result() if resolution is not None else None for resolution in resolutions]
 
-        return None
+        canonical_by_doi = self._fetch_canonical_by_dois([doi for doi in resolved_dois if doi])
+        upgraded: List[Optional[Paper]] = []
+        for resolved_doi in resolved_dois:
+            canonical = canonical_by_doi.get(resolved_doi) if resolved_doi else None
+            upgraded.append(canonical if canonical and normalize_doi(canonical.doi) else None)
+        return upgraded
 
     def _select_top_k_doi_backed(
         self,
@@ -348,8 +494,12 @@ class PaperSearchService:
         selected: List[Paper] = []
         seen_dois: Set[str] = set()
         upgrade_attempts = 0
+        # Upgrades run in batches: when the scan reaches a DOI-less paper that has not been
+        # upgraded yet, it upgrades together the DOI-less papers it could still need before
+        # the DOI-backed papers further down fill the remaining slots.
+        upgrades: Dict[int, Optional[Paper]] = {}
 
-        for paper in merged_ranked:
+        for index, paper in enumerate(merged_ranked):
             if len(selected) >= k:
                 break
 
@@ -363,8 +513,21 @@ class PaperSearchService:
             if upgrade_attempts >= max_upgrade_attempts:
                 continue
 
+            if index not in upgrades:
+                batch = self._plan_upgrade_batch(
+                    merged_ranked,
+                    start=index,
+                    slots=k - len(selected),
+                    max_batch=max_upgrade_attempts - upgrade_attempts,
+                    seen_dois=seen_dois,
+                )
+                results = self._upgrade_many_to_doi_backed(
+                    [merged_ranked[position] for position in batch], query_fallback_title=query
+                )
+                upgrades.update(zip(batch, results))
+
             upgrade_attempts += 1
-            upgraded = self._upgrade_to_doi_backed(paper, query_fallback_title=query)
+            upgraded = upgrades.pop(index)
             if not upgraded:
                 continue
 
@@ -377,23 +540,181 @@ class PaperSearchService:
 
         return selected
 
-    def _fetch_canonical_by_doi(self, doi: str) -> Optional[Paper]:
-        crossref_work = self.crossref.works_by_doi(doi)
-        if crossref_work:
-            return crossref_work_to_paper(crossref_work)
-
-        datacite_work = self.datacite.get_by_doi(doi)
-        if datacite_work:
-            return datacite_work_to_paper(datacite_work)
+    @staticmethod
+    def _plan_upgrade_batch(
+        merged_ranked: List[Paper],
+        *,
+        start: int,
+        slots: int,
+        max_batch: int,
+        seen_dois: Set[str],
+    ) -> List[int]:
+        """Return positions of the DOI-less papers that may be needed to fill ``slots``.
+
+        Collection stops once the DOI-less papers gathered plus the new DOI-backed papers
+        passed on the way could fill every slot, so no paper is upgraded that a successful
+        sequential scan would never have reached.
+        """
+
+        batch: List[int] = []
+        passed_dois: Set[str] = set()
+        for position in range(start, len(merged_ranked)):
+            if len(batch) >= max_batch or len(batch) + len(passed_dois) >= slots:
+                break
+            doi = normalize_doi(merged_ranked[position].doi)
+            if not doi:
+                batch.append(position)
+            elif doi not in seen_dois:
+                passed_dois.add(doi)
+        return batch
 
-        openalex_work = self.openalex.get_work_by_doi(doi)
-        if openalex_work:
-            return openalex_work_to_paper(openalex_work)
+    def _fetch_canonical_by_doi(self, doi: str) -> Optional[Paper]:
+        cached = self._cached_canonical(doi)
+        if cached is not None:
+            return cached
+        canonical = self._probe_canonical_by_doi(doi)
+        if canonical is not None:
+            self._store_canonical(doi, canonical)
+        return canonical
+
+    def _probe_canonical_by_doi(self, doi: str) -> Optional[Paper]:
+        # Probe every provider at once but honour their priority: a hit only wins once
+        # every higher-priority provider has missed.
+        registrar = _doi_registrar(doi)
+        probes: List[Tuple[Future[Any], Callable[[Any], Paper]]] = []
+        if registrar != "datacite":
+            probes.append((self._executor.submit(self.crossref.works_by_doi, doi), crossref_work_to_paper))
+        if registrar != "crossref":
+            probes.append((self._executor.submit(self.datacite.get_by_doi, doi), datacite_work_to_paper))
+        probes.append((self._executor.submit(self.openalex.get_work_by_doi, doi), openalex_work_to_paper))
+        probes.append(
+            (
+                self._executor.submit(self.semanticscholar.get_by_doi, doi, fields=DEFAULT_FIELDS),
+                semanticscholar_paper_to_paper,
+            )
+        )
+        try:
+            for probe, to_paper in probes:
+                record = probe.result()
+                if record:
+                    return to_paper(record)
+            return None
+        finally:
+            for probe, _ in probes:
+                probe.cancel()
+
+    def _fetch_canonical_by_dois(self, dois: Sequence[str]) -> Dict[str, Paper]:
+        """Batch counterpart of :meth:`_fetch_canonical_by_doi`, keyed by the given DOIs.
+
+        Each provider is queried once for all uncached DOIs, and a DOI takes its record
+        from the highest-priority provider that knows it.
+        """
+
+        canonical: Dict[str, Paper] = {}
+        unique_dois: List[str] = []
+        for doi in dict.fromkeys(dois):
+            cached = self._cached_canonical(doi)
+            if cached is not None:
+                canonical[doi] = cached
+            else:
+                unique_dois.append(doi)
+        if not unique_dois:
+            return canonical
 
-        semantic_record = self.semanticscholar.get_by_doi(doi, fields=DEFAULT_FIELDS)
-        if semantic_record:
-            return semanticscholar_paper_to_paper(semantic_record)
-        return None
+        registrars = {doi: _doi_registrar(doi) for doi in unique_dois}
+        crossref_dois = [doi for doi in unique_dois if registrars[doi] != "datacite"]
+        datacite_dois = [doi for doi in unique_dois if registrars[doi] != "crossref"]
+        lookups: List[Tuple[Future[Sequence[Any]], List[str], Callable[[Any], Paper]]] = []
+        if crossref_dois:
+            lookups.append(
+                (
+                    self._executor.submit(self.crossref.works_by_dois, crossref_dois),
+                    crossref_dois,
+                    crossref_work_to_paper,
+                )
+            )
+        if datacite_dois:
+            lookups.append(
+                (
+                    self._executor.submit(self.datacite.get_by_dois, datacite_dois),
+                    datacite_dois,
+                    datacite_work_to_paper,
+                )
+            )
+        lookups.append(
+            (self._executor.submit(self.openalex.get_works_by_dois, unique_dois), unique_dois, openalex_work_to_paper)
+        )
+        lookups.append(
+            (
+                self._executor.submit(self.semanticscholar.get_by_dois, unique_dois, fields=DEFAULT_FIELDS),
+                unique_dois,
+                semanticscholar_paper_to_paper,
+            )
+        )
+        fetched: Dict[str, Paper] = {}
+        try:
+            for lookup, lookup_dois, to_paper in lookups:
+                if len(fetched) == len(unique_dois):
+                    break
+                for doi, record in zip(lookup_dois, lookup.result()):
+                    if record and doi not in fetched:
+                        fetched[doi] = to_paper(record)
+        finally:
+            for lookup, _, _ in lookups:
+                lookup.cancel()
+
+        for doi, paper in fetched.items():
+            self._store_canonical(doi, paper)
+        canonical.update(fetched)
+        return canonical
+
+    def _cached_search(self, key: _SearchKey) -> Optional[Tuple[List[Paper], List[Paper]]]:
+        with self._cache_lock:
+            entry = self._search_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, merged, raw = entry
+            if expires_at <= time.monotonic():
+                del self._search_cache[key]
+                return None
+            self._search_cache.move_to_end(key)
+        # Hand out copies: callers enrich returned papers in place.
+        return [_copy_paper(paper) for paper in merged], [_copy_paper(paper) for paper in raw]
+
+    def _store_search(self, key: _SearchKey, merged: List[Paper], raw: List[Paper]) -> None:
+        if self._search_cache_ttl <= 0:
+            return
+        entry = (
+            time.monotonic() + self._search_cache_ttl,
+            [_copy_paper(paper) for paper in merged],
+            [_copy_paper(paper) for paper in raw],
+        )
+        with self._cache_lock:
+            self._search_cache[key] = entry
+            self._search_cache.move_to_end(key)
+            if len(self._search_cache) > _SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+
+    def _cached_canonical(self, doi: str) -> Optional[Paper]:
+        key = normalize_doi(doi)
+        if not key:
+            return None
+        with self._cache_lock:
+            paper = self._canonical_cache.get(key)
+            if paper is None:
+                return None
+            self._canonical_cache.move_to_end(key)
+        return _copy_paper(paper)
+
+    def _store_canonical(self, doi: str, paper: Paper) -> None:
+        key = normalize_doi(doi)
+        if not key or self._cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._canonical_cache[key] = _copy_paper(paper)
+            self._canonical_cache.move_to_end(key)
+            if len(self._canonical_cache) > self._cache_size:
+                self._canonical_cache.popitem(last=False)
 
     def _build_openalex_filters(
         self, *, min_year: Optional[int], max_year: Optional[int]
@@ -405,49 +726,60 @@ class PaperSearchService:
             filters["to_publication_date"] = f"{max_year}-12-31"
         return filters
 
-    def _append_unique(
-        self, incoming: Iterable[Paper], target: List[Paper], seen: Set[str]
-    ) -> None:
-        for paper in incoming:
-            key = self._make_group_key(paper)
-            if key in seen:
-                continue
-            seen.add(key)
-            target.append(paper)
+    def _dedupe_by_group_key(self, papers: Iterable[Paper]) -> List[Paper]:
+        unique: Dict[str, Paper] = {}
+        for paper in papers:
+            unique.setdefault(self._make_group_key(paper), paper)
+        return list(unique.values())
 
     def _append_to_groups(
-        self, incoming: Iterable[Paper], grouped: Dict[str, List[Paper]], order: List[str]
+        self,
+        incoming: Iterable[Paper],
+        grouped: Dict[str, List[Paper]],
+        prefix_index: PrefixIndex,
     ) -> None:
+        soft_grouping = self.enable_soft_grouping
         for paper in incoming:
             key = self._make_group_key(paper)
-            if self.enable_soft_grouping:
-                soft_key = self._find_soft_group_match(paper, grouped)
+            # Papers with a DOI identity keep it; only title-keyed papers look for a soft match.
+            if soft_grouping and not key.startswith("doi:"):
+                soft_key = self._find_soft_group_match(paper, prefix_index)
                 if soft_key:
                     key = soft_key
-            if key not in grouped:
-                grouped[key] = []
-                order.append(key)
-            grouped[key].append(paper)
+            group = grouped.get(key)
+            if group is None:
+                group = grouped[key] = []
+                title = paper.title
+                if soft_grouping and title:
+                    _, tokens = _title_tokens(title)
+                    if tokens:
+                        prefix_index.setdefault(self._title_prefix(tokens), []).append(
+                            (key, _title_token_set(title))
+                        )
+            group.append(paper)
 
     def _make_group_key(self, paper: Paper) -> str:
         normalized_doi = normalize_doi(paper.doi)
         if normalized_doi:
             return f"doi:{normalized_doi}"
 
-        paper_id_doi = self._paper_id_as_doi(paper.paper_id)
+        paper_id = paper.paper_id
+        paper_id_doi = self._paper_id_as_doi(paper_id)
         if paper_id_doi:
             return f"doi:{paper_id_doi}"
 
-        normalized_title = normalize_title(paper.title or paper.paper_id or "")
-        components = [normalized_title]
-
-        tokens = self._tokenize_title(normalized_title)
-        ambiguous_title = len(tokens) <= 3 or len(normalized_title) <= 25
+        normalized_title, tokens = _title_tokens(paper.title or paper_id or "")
+        if len(tokens) > 3 and len(normalized_title) > 25:
+            return normalized_title
 
-        if ambiguous_title and paper.year:
-            components.append(str(paper.year))
-        if ambiguous_title and paper.authors:
-            components.append(normalize_title(paper.authors[0]))
+        # Short titles are ambiguous on their own; qualify them with year and first author.
+        components = [normalized_title]
+        year = paper.year
+        if year:
+            components.append(str(year))
+        authors = paper.authors
+        if authors:
+            components.append(normalize_title(authors[0]))
         return "|".join(components)
 
     def _paper_id_as_doi(self, paper_id: Optional[str]) -> Optional[str]:
@@ -461,61 +793,40 @@ class PaperSearchService:
         return None
 
     def _find_soft_group_match(
-        self, paper: Paper, grouped: Dict[str, List[Paper]]
+        self, paper: Paper, prefix_index: PrefixIndex
     ) -> Optional[str]:
-        normalized_doi = normalize_doi(paper.doi)
-        if normalized_doi or not paper.title:
+        title = paper.title
+        if not title:
             return None
 
-        normalized_title = normalize_title(paper.title)
-        candidate_tokens = self._tokenize_title(normalized_title)
+        normalized_title, candidate_tokens = _title_tokens(title)
         if not candidate_tokens:
             return None
         if len(candidate_tokens) <= 3 or len(normalized_title) <= 25:
             return None
 
         prefix = self._title_prefix(candidate_tokens)
+        candidate_set = _title_token_set(title)
 
         best_key: Optional[str] = None
         best_score = 0.0
 
-        for key, grouped_papers in grouped.items():
-            representative = grouped_papers[0]
-            if not representative.title:
-                continue
-
-            representative_tokens = self._tokenize_title(
-                normalize_title(representative.title)
-            )
-            if not representative_tokens:
-                continue
-
-            if self._title_prefix(representative_tokens) != prefix:
-                continue
-
-            similarity = self._jaccard_similarity(candidate_tokens, representative_tokens)
+        # Only groups whose representative shares the title prefix can match.
+        for key, group_tokens in prefix_index.get(prefix, ()):
+            similarity = self._jaccard_similarity(candidate_set, group_tokens)
             if similarity >= self.soft_grouping_threshold and similarity > best_score:
                 best_key = key
                 best_score = similarity
 
         return best_key
 
-    def _tokenize_title(self, normalized_title: str) -> List[str]:
-        if not normalized_title:
-            return []
-        return re.findall(r"[a-z0-9]+", normalized_title)
-
-    def _title_prefix(self, tokens: List[str]) -> str:
+    def _title_prefix(self, tokens: Sequence[str]) -> str:
         return " ".join(tokens[: self.soft_grouping_prefix_tokens])
 
-    def _jaccard_similarity(self, left: List[str], right: List[str]) -> float:
+    def _jaccard_similarity(self, left: FrozenSet[str], right: FrozenSet[str]) -> float:
         if not left or not right:
             return 0.0
 
-        left_set = set(left)
-        right_set = set(right)
-        intersection = len(left_set & right_set)
-        union = len(left_set | right_set)
-        if union == 0:
-            return 0.0
-        return intersection / union
+        # len(A | B) == len(A) + len(B) - len(A & B), so only the intersection is built.
+        intersection = len(left & right)
+        return intersection / (len(left) + len(right) - intersection)
@@ -163,3 +163,26 @@ def test_http_500_retries():
         client._request("GET", "/resource")
 
     assert client.stub_session.calls == 3
+
+
+def test_decode_json_uses_orjson_when_available(monkeypatch):
+    response = _make_response(200, body='{"data": [1, 2]}')
+
+    def _stub_orjson_loads(content: bytes) -> Any:
+        assert isinstance(content, bytes)
+        return {"decoded_by": "orjson"}
+
+    monkeypatch.setattr(base, "_orjson_loads", None)
+    assert base.decode_json(response) == {"data": [1, 2]}
+
+    monkeypatch.setattr(base, "_orjson_loads", _stub_orjson_loads)
+    assert base.decode_json(response) == {"decoded_by": "orjson"}
+
+
+def test_new_pooled_session_mounts_sized_adapters():
+    session = base.new_pooled_session()
+
+    for prefix in ("https://", "http://"):
+        adapter = session.get_adapter(f"{prefix}example.test")
+        assert adapter._pool_maxsize == base.DEFAULT_POOL_MAXSIZE
+        assert adapter._pool_connections == base.DEFAULT_POOL_CONNECTIONS
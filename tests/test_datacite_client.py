@@ -1,4 +1,4 @@
-from literature_retrieval_engine.providers.clients.datacite import DataCiteClient
+from literature_retrieval_engine.providers.clients.datacite import DataCiteClient, DataCiteWork
 
 
 def test_datacite_client_exact_then_fallback(monkeypatch):
@@ -43,3 +43,24 @@ def test_datacite_client_exact_then_fallback(monkeypatch):
     assert works[0].year == 2024
     assert works[0].venue == "DataCite Press"
     assert works[0].authors == ["Ada Lovelace"]
+
+
+def test_get_by_dois_preserves_input_order(monkeypatch):
+    def fake_get_by_doi(self, doi):  # type: ignore[override]
+        if doi == "10.1234/missing":
+            return None
+        return DataCiteWork(doi=doi, title=doi, year=None, venue=None, url=None, authors=[])
+
+    monkeypatch.setattr(DataCiteClient, "get_by_doi", fake_get_by_doi)
+
+    client = DataCiteClient()
+    dois = ["10.1234/a", "10.1234/missing", "10.1234/b", "10.1234/c"]
+    works = client.get_by_dois(dois, max_concurrency=3)
+
+    assert [work.doi if work else None for work in works] == [
+        "10.1234/a",
+        None,
+        "10.1234/b",
+        "10.1234/c",
+    ]
+    assert client.get_by_dois([]) == []
@@ -120,3 +120,22 @@ def test_resolve_rejects_near_match_without_author_overlap_when_expected():
     resolved = resolver.resolve_doi_from_title(title, expected_authors=["Alice Smith"])
 
     assert resolved is None
+
+
+def test_resolve_reuses_the_instance_executor(monkeypatch):
+    import literature_retrieval_engine.services.doi_resolver_service as module
+
+    title = "A Precise Study"
+    work = CrossrefWork(title=title, doi="10.1111/title-match", year=2020, venue=None, authors=[], url=None)
+    resolver = DoiResolverService(crossref=StubCrossrefService([work]), datacite=StubDataCiteService([]))
+
+    def unexpected_executor(*args, **kwargs):
+        raise AssertionError("resolve_doi_from_title should not create a thread pool per call")
+
+    monkeypatch.setattr(module, "ThreadPoolExecutor", unexpected_executor)
+
+    try:
+        assert resolver.resolve_doi_from_title(title) == "10.1111/title-match"
+        assert resolver.resolve_doi_from_title(title) == "10.1111/title-match"
+    finally:
+        resolver.close()
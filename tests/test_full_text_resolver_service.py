@@ -1,3 +1,5 @@
+import pytest
+
 from literature_retrieval_engine.core.models import Paper
 from literature_retrieval_engine.providers.clients.unpaywall import OpenAccessLocation, UnpaywallRecord
 from literature_retrieval_engine.services.full_text_resolver_service import (
@@ -246,3 +248,321 @@ def test_apply_sets_pdf_url_provenance_from_arxiv():
     assert paper.pdf_url == "https://arxiv.org/pdf/2401.12345.pdf"
     assert paper.provenance is not None
     assert paper.provenance.field_sources["pdf_url"].source == "arxiv"
+
+
+def test_resolve_fans_out_when_an_io_resolver_is_present():
+    best_location = OpenAccessLocation(
+        url="https://example.org/landing",
+        url_for_pdf="https://example.org/best.pdf",
+        version="publishedVersion",
+        license="cc-by",
+        host_type="publisher",
+        is_best=True,
+    )
+    record = UnpaywallRecord(
+        doi="10.1234/example",
+        title="Sample",
+        best_oa_location=best_location,
+        oa_locations=[best_location],
+    )
+    service = FullTextResolverService(
+        resolvers=[ArxivDeterministicResolver(), UnpaywallResolver(FakeUnpaywallClient(record))]
+    )
+    local_only = FullTextResolverService(resolvers=[ArxivDeterministicResolver()])
+    paper = Paper(
+        paper_id="paper-9",
+        title="Sample",
+        doi="10.1234/example",
+        abstract=None,
+        year=None,
+        venue=None,
+        source="test",
+        url="https://arxiv.org/abs/2401.12345",
+    )
+
+    resolution = service.resolve(paper)
+
+    assert service._executor is not None
+    assert local_only._executor is None
+    assert [candidate.source for candidate in resolution.candidates] == ["unpaywall", "arxiv"]
+    assert resolution.oa_signal is True
+
+
+def test_resolve_many_fetches_each_doi_once_and_preserves_order():
+    location = OpenAccessLocation(
+        url="https://example.org/landing",
+        url_for_pdf="https://example.org/best.pdf",
+        version="publishedVersion",
+        license="cc-by",
+        host_type="publisher",
+        is_best=True,
+    )
+    record = UnpaywallRecord(
+        doi="10.1234/example",
+        title="Sample",
+        best_oa_location=location,
+        oa_locations=[location],
+    )
+
+    class CountingClient(FakeUnpaywallClient):
+        def __init__(self) -> None:
+            super().__init__(record)
+            self.requested: list[str] = []
+
+        def get_record(self, doi: str) -> UnpaywallRecord | None:
+            self.requested.append(doi)
+            return self.record if doi == "10.1234/example" else None
+
+    client = CountingClient()
+    service = FullTextResolverService(resolvers=[UnpaywallResolver(client), UpstreamFieldsResolver()])
+    papers = [
+        Paper(paper_id=f"p{index}", title="Sample", doi=doi, abstract=None, year=None, venue=None, source="test")
+        for index, doi in enumerate(["10.1234/example", None, "10.1234/example", "10.9/missing"])
+    ]
+
+    resolutions = service.resolve_many(papers)
+
+    assert sorted(client.requested) == ["10.1234/example", "10.9/missing"]
+    assert [resolution.best.pdf_url if resolution.best else None for resolution in resolutions] == [
+        "https://example.org/best.pdf",
+        None,
+        "https://example.org/best.pdf",
+        None,
+    ]
+    assert [resolution.oa_signal for resolution in resolutions] == [True, None, True, None]
+
+
+def test_unpaywall_resolver_memoizes_records_per_doi():
+    class CountingClient(FakeUnpaywallClient):
+        calls = 0
+
+        def get_record(self, doi: str) -> UnpaywallRecord | None:
+            self.calls += 1
+            return self.record
+
+    client = CountingClient(None)
+    resolver = UnpaywallResolver(client, cache_size=1)
+    paper = Paper(
+        paper_id="paper-10",
+        title="Sample",
+        doi="10.1234/Example",
+        abstract=None,
+        year=None,
+        venue=None,
+        source="test",
+    )
+    other = Paper(
+        paper_id="paper-11",
+        title="Sample",
+        doi="10.1234/other",
+        abstract=None,
+        year=None,
+        venue=None,
+        source="test",
+    )
+
+    resolver.resolve(paper)
+    resolver.resolve(paper)
+    assert client.calls == 1
+
+    resolver.resolve(other)
+    resolver.resolve(paper)
+    assert client.calls == 3
+
+
+def test_arxiv_landing_url_ignores_query_and_fragment():
+    resolver = ArxivDeterministicResolver()
+    paper = Paper(
+        paper_id="paper-12",
+        title="Sample",
+        doi=None,
+        abstract=None,
+        year=None,
+        venue=None,
+        source="test",
+        url="https://arxiv.org/abs/2101.00001v2?context=cs#section",
+    )
+
+    candidates = resolver.resolve(paper)
+
+    assert [candidate.pdf_url for candidate in candidates] == [
+        "https://arxiv.org/pdf/2101.00001v2.pdf"
+    ]
+
+
+def test_resolve_caches_resolution_until_invalidated():
+    class CountingResolver(UpstreamFieldsResolver):
+        calls = 0
+
+        def resolve(self, paper: Paper):
+            self.calls += 1
+            return super().resolve(paper)
+
+    counting = CountingResolver()
+    service = FullTextResolverService(resolvers=[counting])
+    paper = Paper(
+        paper_id="paper-13",
+        title="Sample",
+        doi=None,
+        abstract=None,
+        year=None,
+        venue=None,
+        source="test",
+        pdf_url="https://example.org/paper.pdf",
+    )
+
+    first = service.resolve(paper)
+    assert service.resolve(paper) is first
+    assert service.resolve_many([paper]) == [first]
+    assert counting.calls == 1
+
+    service.invalidate(paper)
+    service.resolve(paper)
+    assert counting.calls == 2
+
+
+def test_unpaywall_resolver_skips_arxiv_dois_without_a_request():
+    class FailingClient(FakeUnpaywallClient):
+        def get_record(self, doi: str) -> UnpaywallRecord | None:
+            raise AssertionError("Unpaywall should not be queried for arXiv DOIs")
+
+    resolver = UnpaywallResolver(FailingClient(None))
+    paper = Paper(
+        paper_id="paper-14",
+        title="Sample",
+        doi="10.48550/arXiv.2401.12345",
+        abstract=None,
+        year=None,
+        venue=None,
+        source="test",
+    )
+
+    assert resolver.resolve(paper) == []
+
+
+def test_resolve_many_matches_resolve_ordering():
+    papers = [
+        Paper(
+            paper_id=f"p{index}",
+            title="Sample",
+            doi=doi,
+            abstract=None,
+            year=None,
+            venue=None,
+            source="test",
+            pdf_url=pdf_url,
+        )
+        for index, (doi, pdf_url) in enumerate(
+            [
+                ("10.48550/arXiv.2401.00001", "https://example.org/a.pdf"),
+                (None, None),
+                ("10.48550/arXiv.2401.00002", "https://arxiv.org/pdf/2401.00002.pdf"),
+            ]
+        )
+    ]
+    resolvers = [ArxivDeterministicResolver(), UpstreamFieldsResolver()]
+
+    batched = FullTextResolverService(resolvers=resolvers).resolve_many(papers)
+    single = [FullTextResolverService(resolvers=resolvers).resolve(paper) for paper in papers]
+
+    assert batched == single
+    assert [candidate.source for candidate in batched[0].candidates] == ["upstream_fields", "arxiv"]
+
+
+def test_transient_unpaywall_failure_is_not_cached():
+    from literature_retrieval_engine.providers.clients.base import UpstreamError
+
+    location = OpenAccessLocation(
+        url="https://example.org/landing",
+        url_for_pdf="https://example.org/best.pdf",
+        version="publishedVersion",
+        license="cc-by",
+        host_type="publisher",
+        is_best=True,
+    )
+    record = UnpaywallRecord(
+        doi="10.1234/example",
+        title="Sample",
+        best_oa_location=location,
+        oa_locations=[location],
+    )
+
+    class FlakyClient(FakeUnpaywallClient):
+        def __init__(self) -> None:
+            super().__init__(record)
+            self.calls = 0
+
+        def get_record(self, doi: str) -> UnpaywallRecord | None:
+            self.calls += 1
+            if self.calls == 1:
+                raise UpstreamError("temporarily unavailable")
+            return self.record
+
+    paper = Paper(
+        paper_id="paper-flaky",
+        title="Sample",
+        doi="10.1234/example",
+        abstract=None,
+        year=None,
+        venue=None,
+        source="test",
+    )
+
+    client = FlakyClient()
+    service = FullTextResolverService(resolvers=[UnpaywallResolver(client), UpstreamFieldsResolver()])
+    assert service.resolve(paper).best is None
+    retried = service.resolve(paper)
+    assert client.calls == 2
+    assert retried.best is not None and retried.best.pdf_url == "https://example.org/best.pdf"
+
+    batch_client = FlakyClient()
+    batch_service = FullTextResolverService(resolvers=[UnpaywallResolver(batch_client), UpstreamFieldsResolver()])
+    assert batch_service.resolve_many([paper])[0].best is None
+    retried_batch = batch_service.resolve_many([paper])[0]
+    assert batch_client.calls == 2
+    assert retried_batch.best is not None and retried_batch.best.pdf_url == "https://example.org/best.pdf"
+
+
+def test_interrupted_unpaywall_lookup_releases_waiters():
+    from literature_retrieval_engine.providers.clients.base import ClientError
+
+    record = UnpaywallRecord(doi="10.1234/example", title="Sample", best_oa_location=None, oa_locations=[])
+    in_flight = []
+
+    class InterruptedClient(FakeUnpaywallClient):
+        def get_record(self, doi: str) -> UnpaywallRecord | None:
+            if not in_flight:
+                in_flight.append(resolver._records[doi])
+                raise KeyboardInterrupt
+            return self.record
+
+    resolver = UnpaywallResolver(InterruptedClient(record))
+
+    with pytest.raises(KeyboardInterrupt):
+        resolver._fetch_record("10.1234/example")
+
+    future = in_flight[0]
+    assert future.done()
+    assert isinstance(future.exception(), ClientError)
+    assert resolver._fetch_record("10.1234/example") is record
+
+
+def test_custom_resolver_resolutions_are_cached_per_paper():
+    from literature_retrieval_engine.services.full_text_resolver_service import FullTextCandidate
+
+    class TitleResolver:
+        def resolve(self, paper: Paper) -> list[FullTextCandidate]:
+            return [FullTextCandidate(pdf_url=f"https://example.org/{paper.title}.pdf", source="title")]
+
+    def make_paper(title: str) -> Paper:
+        return Paper(
+            paper_id=title, title=title, doi="10.1234/shared", abstract=None, year=None, venue=None, source="test"
+        )
+
+    service = FullTextResolverService(resolvers=[TitleResolver()])
+
+    assert service.resolve(make_paper("first")).best.pdf_url == "https://example.org/first.pdf"
+    assert service.resolve(make_paper("second")).best.pdf_url == "https://example.org/second.pdf"
+    assert [resolution.best.pdf_url for resolution in service.resolve_many([make_paper("third")])] == [
+        "https://example.org/third.pdf"
+    ]
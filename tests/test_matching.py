@@ -1,4 +1,4 @@
-from literature_retrieval_engine.core.matching import jaccard, title_tokens
+from literature_retrieval_engine.core.matching import jaccard, jaccard_upper_bound, title_tokens
 
 
 def test_title_tokens_normalize_and_strip_punctuation():
@@ -17,3 +17,13 @@ def test_jaccard_similarity_calculates_overlap():
     second = {"alpha", "beta", "delta"}
 
     assert jaccard(first, second) == 0.5
+
+
+def test_jaccard_upper_bound_never_underestimates_similarity():
+    first = {"alpha", "beta", "gamma", "delta"}
+    second = {"alpha", "beta"}
+
+    assert jaccard_upper_bound(len(first), len(second)) == 0.5
+    assert jaccard_upper_bound(len(first), len(second)) >= jaccard(first, second)
+    assert jaccard_upper_bound(0, 0) == 1.0
+    assert jaccard_upper_bound(0, 3) == 0.0
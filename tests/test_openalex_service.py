@@ -92,3 +92,36 @@ def test_get_work_by_external_id_encodes_path_and_logs_non_200(caplog):
     expected_path = quote(doi_url, safe="")
     assert session.calls[0]["url"].endswith(f"/works/{expected_path}")
     assert any("status=403" in record.message for record in caplog.records)
+
+
+def test_get_citing_works_stops_after_a_short_page():
+    payload = _load_fixture("openalex_work_sample.json")
+    session = _CapturingSession(
+        [
+            _make_response(200, {"results": [payload, payload], "meta": {"next_cursor": "page-2"}}),
+            _make_response(200, {"results": [payload], "meta": {"next_cursor": "page-3"}}),
+        ]
+    )
+    client = OpenAlexClient(session=session)
+
+    works = client.get_citing_works("W1", per_page=2)
+
+    assert len(works) == 3
+    assert len(session.calls) == 2
+
+
+def test_get_works_by_dois_batches_dois_into_one_or_filter():
+    payload = _load_fixture("openalex_work_sample.json")
+    session = _CapturingSession([_make_response(200, {"results": [payload]})])
+    client = OpenAlexClient(session=session)
+
+    works = client.get_works_by_dois(["10.5555/missing", "https://doi.org/10.1234/EXAMPLE", ""])
+
+    assert len(session.calls) == 1
+    assert session.calls[0]["params"] == {
+        "filter": "doi:https://doi.org/10.5555/missing|https://doi.org/10.1234/example",
+        "per-page": 2,
+    }
+    assert works[0] is None
+    assert works[1] is not None and works[1].doi == "10.1234/example"
+    assert works[2] is None
@@ -65,3 +65,105 @@ def test_enrich_is_noop_without_doi() -> None:
 
     assert enriched.pdf_url is None
     assert enriched.is_oa is None
+
+
+def _pdf_record(doi: str) -> UnpaywallRecord:
+    location = OpenAccessLocation(
+        url=f"https://example.org/{doi}",
+        url_for_pdf=f"https://example.org/{doi}.pdf",
+        version="publishedVersion",
+        license="cc-by",
+        host_type="publisher",
+        is_best=True,
+    )
+    return UnpaywallRecord(doi=doi, title="Example", best_oa_location=location, oa_locations=[location])
+
+
+class RecordsByDoiClient:
+    def __init__(self, records: dict[str, UnpaywallRecord]) -> None:
+        self.records = records
+        self.requested: list[str] = []
+
+    def get_record(self, doi: str) -> UnpaywallRecord | None:
+        self.requested.append(doi)
+        return self.records.get(doi)
+
+
+def _papers() -> list[Paper]:
+    return [
+        Paper(paper_id=str(index), title="Example", doi=doi, abstract=None, year=None, venue=None, source="test")
+        for index, doi in enumerate(["10.1/a", None, "10.1/missing", "10.1/b"])
+    ]
+
+
+def test_enrich_many_matches_enrich_and_preserves_order() -> None:
+    from literature_retrieval_engine.services.full_text_resolver_service import FullTextResolverService
+
+    records = {"10.1/a": _pdf_record("10.1/a"), "10.1/b": _pdf_record("10.1/b")}
+
+    def make_service() -> PaperEnrichmentService:
+        resolver = FullTextResolverService(unpaywall_client=RecordsByDoiClient(records))  # type: ignore[arg-type]
+        return PaperEnrichmentService(resolver=resolver)
+
+    papers = _papers()
+    enriched = make_service().enrich_many(papers)
+    single_service = make_service()
+    expected = [single_service.enrich(paper) for paper in _papers()]
+
+    assert all(result is paper for result, paper in zip(enriched, papers))
+    assert [(paper.paper_id, paper.resolved_pdf_url, paper.is_oa) for paper in enriched] == [
+        (paper.paper_id, paper.resolved_pdf_url, paper.is_oa) for paper in expected
+    ]
+    assert enriched[0].resolved_pdf_url == "https://example.org/10.1/a.pdf"
+    assert enriched[0].is_oa is True
+    assert enriched[1].resolved_pdf_url is None
+
+
+def test_gather_evidence_enriches_papers_with_one_batched_unpaywall_fetch(monkeypatch) -> None:
+    from literature_retrieval_engine.api import RetrievalClient
+    from literature_retrieval_engine.core.settings import RetrievalSettings
+    from literature_retrieval_engine.services.full_text_resolver_service import (
+        FullTextResolverService,
+        UnpaywallResolver,
+    )
+
+    papers = _papers()
+
+    class StubSearchService:
+        def search(self, query, **kwargs):
+            return papers
+
+    class CapturingEvidenceService:
+        gathered: list[Paper] = []
+
+        def gather(self, to_gather):
+            CapturingEvidenceService.gathered = list(to_gather)
+            return []
+
+    batches: list[list[str]] = []
+    original_fetch_records = UnpaywallResolver.fetch_records
+
+    def counting_fetch_records(self, dois, **kwargs):
+        batches.append(list(dois))
+        return original_fetch_records(self, dois, **kwargs)
+
+    def unexpected_apply(self, paper):
+        raise AssertionError("gather_evidence should enrich papers in a batch")
+
+    monkeypatch.setattr(UnpaywallResolver, "fetch_records", counting_fetch_records)
+    monkeypatch.setattr(FullTextResolverService, "apply", unexpected_apply)
+
+    unpaywall = RecordsByDoiClient({"10.1/a": _pdf_record("10.1/a")})
+    client = RetrievalClient(
+        settings=RetrievalSettings(),
+        search_service=StubSearchService(),  # type: ignore[arg-type]
+        unpaywall_client=unpaywall,  # type: ignore[arg-type]
+    )
+    client._evidence_service = CapturingEvidenceService()  # type: ignore[assignment]
+
+    client.gather_evidence("example")
+
+    assert len(batches) == 1
+    assert sorted(unpaywall.requested) == ["10.1/a", "10.1/b", "10.1/missing"]
+    assert [paper.paper_id for paper in CapturingEvidenceService.gathered] == ["0", "1", "2", "3"]
+    assert CapturingEvidenceService.gathered[0].resolved_pdf_url == "https://example.org/10.1/a.pdf"
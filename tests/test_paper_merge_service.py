@@ -436,3 +436,49 @@ def test_source_prefers_identifier_evidence_over_other_fields() -> None:
     assert merged.title == "Fresh and Improved Title"
     assert merged.source == "crossref"
     assert merged.provenance.field_sources["title"].source == "openalex"
+
+
+def test_merge_ranks_grouped_priorities_and_unknown_sources() -> None:
+    def record(source: str, venue: str) -> Paper:
+        return Paper(
+            paper_id=f"{source}:1",
+            title="Example",
+            doi=None,
+            abstract=None,
+            year=None,
+            venue=venue,
+            source=source,
+        )
+
+    service = PaperMergeService(source_priority=[("openalex", "datacite"), "crossref"])
+
+    merged = service.merge(
+        [record("unknown", "Unknown Venue"), record("crossref", "Crossref Venue"), record("datacite", "DataCite Venue")]
+    )
+
+    assert merged.venue == "DataCite Venue"
+    assert merged.source == "datacite"
+
+
+def test_merge_many_merges_each_group_in_order() -> None:
+    def record(source: str, title: str) -> Paper:
+        return Paper(
+            paper_id=f"{source}:{title}",
+            title=title,
+            doi=None,
+            abstract=None,
+            year=None,
+            venue=None,
+            source=source,
+        )
+
+    service = PaperMergeService()
+    groups = [
+        [record("openalex", "First"), record("crossref", "First (Crossref)")],
+        [record("semanticscholar", "Second")],
+    ]
+
+    merged = service.merge_many(groups)
+
+    assert [paper.title for paper in merged] == ["First (Crossref)", "Second"]
+    assert merged == [service.merge(group) for group in groups]
@@ -1,3 +1,4 @@
+import pytest
 import requests
 
 from literature_retrieval_engine.api import RetrievalClient
@@ -83,3 +84,40 @@ def test_search_by_title_smoke(monkeypatch):
 
     assert papers
     assert papers[0].source == "crossref"
+
+
+def test_normalize_work_falls_back_across_date_fields_and_skips_bad_authors():
+    client = CrossrefClient()
+
+    work = client._normalize_work(
+        {
+            "DOI": "https://doi.org/10.1111/Example",
+            "title": ["Fallback dates"],
+            "author": [{"given": "Ada", "family": "Lovelace"}, "not-a-dict", {"family": "Hopper"}],
+            "issued": {"date-parts": [[None]]},
+            "published-online": {"date-parts": [[2021, 5]]},
+            "container-title": [],
+        }
+    )
+
+    assert work is not None
+    assert work.doi == "10.1111/example"
+    assert work.year == 2021
+    assert work.venue is None
+    assert work.authors == ["Ada Lovelace", "Hopper"]
+    assert client._normalize_work({"title": [], "URL": "https://example.org"}) is None
+
+
+def test_close_shuts_down_service_executors():
+    client = RetrievalClient(settings=RetrievalSettings(unpaywall_email="test@example.com"))
+    client.close()
+
+    executors = [
+        client._search_service._executor,
+        client._doi_resolver._executor,
+        client._full_text_resolver._executor,
+    ]
+    for executor in executors:
+        assert executor is not None
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
@@ -214,3 +214,67 @@ def test_soft_grouping_skips_ambiguous_short_titles():
 
     assert len(raw) == 2
     assert len(merged) == 2
+
+
+def test_soft_grouping_compares_against_group_representatives():
+    service = PaperSearchService(
+        openalex=StubOpenAlexClient([]),
+        semanticscholar=StubSemanticScholarClient([]),
+        crossref=StubCrossrefClient(),
+        datacite=StubDataCiteClient(),
+        doi_resolver=StubDoiResolver(),
+        enable_soft_grouping=True,
+    )
+
+    def make_paper(paper_id, title):
+        return Paper(
+            paper_id=paper_id,
+            title=title,
+            doi=None,
+            abstract=None,
+            year=2022,
+            venue=None,
+            source="openalex",
+            authors=["Ada Lovelace"],
+        )
+
+    representative = make_paper("p1", "Efficient transformers for long document classification tasks")
+    variant = make_paper("p2", "Efficient transformers for long document classification tasks, revisited")
+    unrelated = make_paper("p3", "Graph neural networks for molecular property prediction")
+
+    grouped = {}
+    prefix_index = {}
+    service._append_to_groups([representative, unrelated], grouped, prefix_index)
+    service._append_to_groups([variant], grouped, prefix_index)
+
+    assert len(grouped) == 2
+    assert [[paper.paper_id for paper in group] for group in grouped.values()] == [["p1", "p2"], ["p3"]]
+    assert sorted(key for bucket in prefix_index.values() for key, _ in bucket) == sorted(grouped)
+    assert len(prefix_index) == 2
+
+
+def test_papers_with_a_doi_identity_do_not_join_title_groups():
+    service = PaperSearchService(
+        openalex=StubOpenAlexClient([]),
+        semanticscholar=StubSemanticScholarClient([]),
+        crossref=StubCrossrefClient(),
+        datacite=StubDataCiteClient(),
+        doi_resolver=StubDoiResolver(),
+        enable_soft_grouping=True,
+    )
+
+    title = "Efficient transformers for long document classification tasks"
+    title_only = Paper(
+        paper_id="p1", title=title, doi=None, abstract=None, year=2022, venue=None, source="openalex", authors=[]
+    )
+    with_doi = Paper(
+        paper_id="p2", title=title, doi="10.1000/xyz", abstract=None, year=2022, venue=None, source="crossref"
+    )
+    doi_as_id = Paper(
+        paper_id="10.1000/abc", title=title, doi=None, abstract=None, year=2022, venue=None, source="datacite"
+    )
+
+    grouped = {}
+    service._append_to_groups([title_only, with_doi, doi_as_id], grouped, {})
+
+    assert list(grouped) == [service._make_group_key(title_only), "doi:10.1000/xyz", "doi:10.1000/abc"]
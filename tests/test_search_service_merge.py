@@ -70,3 +70,309 @@ def test_search_merges_duplicates_and_exposes_provenance():
     merged_only, raw_results = service.search_with_raw("merged paper", k=5)
     assert len(raw_results) == 2
     assert merged_only[0].title == "Merged Paper"
+
+
+def test_search_passes_run_concurrently_but_group_in_pass_order():
+    import threading
+
+    both_started = threading.Barrier(2, timeout=5)
+
+    class BlockingOpenAlexClient(StubOpenAlexClient):
+        def search_works(self, query, *args, **kwargs):
+            if query:
+                both_started.wait()
+            return super().search_works(query, *args, **kwargs)
+
+    class BlockingSemanticScholarClient(StubSemanticScholarClient):
+        def search_papers(self, *args, **kwargs):
+            both_started.wait()
+            return super().search_papers(*args, **kwargs)
+
+    openalex_work = OpenAlexWork(
+        openalex_id="W1",
+        openalex_url="https://openalex.org/W1",
+        doi="10.9999/first",
+        title="A Paper From OpenAlex About Concurrency",
+        year=2024,
+        venue=None,
+        abstract=None,
+        authors=[],
+        referenced_works=[],
+        pdf_url=None,
+        is_oa=None,
+    )
+    semantics_paper = SemanticScholarPaper(
+        paper_id="s2:1",
+        doi="10.9999/second",
+        title="A Paper From Semantic Scholar About Concurrency",
+        abstract=None,
+        year=2024,
+        venue=None,
+        url=None,
+        authors=[],
+        pdf_url=None,
+    )
+    service = PaperSearchService(
+        openalex=BlockingOpenAlexClient([openalex_work]),
+        semanticscholar=BlockingSemanticScholarClient([semantics_paper]),
+        crossref=StubCrossrefClient(),
+        enable_openalex_no_stem_pass=False,
+    )
+
+    _, raw_results = service.search_with_raw("concurrency", k=5)
+
+    assert [paper.source for paper in raw_results] == ["openalex", "semanticscholar"]
+
+
+def test_fetch_canonical_by_doi_keeps_provider_priority_when_probing_concurrently():
+    import threading
+    import time
+
+    from literature_retrieval_engine.providers.clients.crossref import CrossrefWork
+    from literature_retrieval_engine.providers.clients.datacite import DataCiteWork
+
+    released = threading.Event()
+
+    class SlowCrossrefClient(StubCrossrefClient):
+        def works_by_doi(self, doi):
+            released.wait(timeout=5)
+            return CrossrefWork(doi=doi, title="Crossref Title", year=None, authors=[], venue=None, url=None)
+
+    class FastDataCiteClient:
+        def get_by_doi(self, doi):
+            released.set()
+            return DataCiteWork(doi=doi, title="DataCite Title", year=None, authors=[], venue=None, url=None)
+
+    class MissingOpenAlexClient(StubOpenAlexClient):
+        def get_work_by_doi(self, doi):
+            return None
+
+    class MissingSemanticScholarClient(StubSemanticScholarClient):
+        def get_by_doi(self, doi, fields=None):
+            return None
+
+    service = PaperSearchService(
+        openalex=MissingOpenAlexClient([]),
+        semanticscholar=MissingSemanticScholarClient([]),
+        crossref=SlowCrossrefClient(),
+        datacite=FastDataCiteClient(),
+    )
+
+    started = time.monotonic()
+    paper = service._fetch_canonical_by_doi("10.1234/example")
+
+    assert paper is not None
+    assert paper.source == "crossref"
+    assert time.monotonic() - started < 5
+
+
+def test_doi_upgrades_fetch_canonical_records_in_one_batch_per_provider():
+    from literature_retrieval_engine.core.models import Paper
+    from literature_retrieval_engine.providers.clients.crossref import CrossrefWork
+    from literature_retrieval_engine.providers.clients.datacite import DataCiteWork
+
+    batches = []
+
+    class BatchCrossrefClient(StubCrossrefClient):
+        def works_by_dois(self, dois):
+            batches.append(list(dois))
+            return [
+                CrossrefWork(doi=doi, title="Crossref Title", year=None, authors=[], venue=None, url=None)
+                if doi == "10.1000/a"
+                else None
+                for doi in dois
+            ]
+
+    class BatchDataCiteClient:
+        def get_by_dois(self, dois):
+            return [
+                DataCiteWork(doi=doi, title="DataCite Title", year=None, authors=[], venue=None, url=None)
+                if doi == "10.1000/b"
+                else None
+                for doi in dois
+            ]
+
+    class BatchOpenAlexClient(StubOpenAlexClient):
+        def get_works_by_dois(self, dois):
+            return [None] * len(dois)
+
+    class BatchSemanticScholarClient(StubSemanticScholarClient):
+        def get_by_dois(self, dois, fields=None):
+            return [None] * len(dois)
+
+    class TitleResolver:
+        def resolve_doi_from_title(self, title, expected_authors=None):
+            return {"Paper A": "10.1000/a", "Paper B": "10.1000/b"}.get(title)
+
+    service = PaperSearchService(
+        openalex=BatchOpenAlexClient([]),
+        semanticscholar=BatchSemanticScholarClient([]),
+        crossref=BatchCrossrefClient(),
+        datacite=BatchDataCiteClient(),
+        doi_resolver=TitleResolver(),
+    )
+
+    def make_paper(title):
+        return Paper(
+            paper_id=title, title=title, doi=None, abstract=None, year=None, venue=None, source="openalex", authors=[]
+        )
+
+    selected = service._select_top_k_doi_backed(
+        [make_paper("Paper A"), make_paper("Unknown"), make_paper("Paper B")],
+        query="query",
+        k=3,
+        max_upgrade_attempts=10,
+    )
+
+    assert batches == [["10.1000/a", "10.1000/b"]]
+    assert [(paper.doi, paper.source) for paper in selected] == [
+        ("10.1000/a", "crossref"),
+        ("10.1000/b", "datacite"),
+    ]
+
+
+def test_doi_upgrade_batches_skip_papers_that_doi_backed_results_will_replace():
+    from dataclasses import replace
+
+    from literature_retrieval_engine.core.models import Paper
+
+    def make_paper(index, doi=None):
+        return Paper(
+            paper_id=str(index),
+            title=f"Paper {index}",
+            doi=doi,
+            abstract=None,
+            year=None,
+            venue=None,
+            source="openalex",
+        )
+
+    ranked = [make_paper(0)]
+    ranked += [make_paper(index, doi=f"10.1000/{index}") for index in range(1, 5)]
+    ranked += [make_paper(index) for index in range(5, 15)]
+
+    def run(upgrade_succeeds):
+        service = PaperSearchService(
+            openalex=StubOpenAlexClient([]),
+            semanticscholar=StubSemanticScholarClient([]),
+            crossref=StubCrossrefClient(),
+            datacite=StubCrossrefClient(),
+        )
+        batches = []
+
+        def upgrade_many(papers, *, query_fallback_title):
+            batches.append([paper.paper_id for paper in papers])
+            if not upgrade_succeeds:
+                return [None] * len(papers)
+            return [replace(paper, doi=f"10.2000/{paper.paper_id}") for paper in papers]
+
+        service._upgrade_many_to_doi_backed = upgrade_many
+        selected = service._select_top_k_doi_backed(ranked, query="query", k=5, max_upgrade_attempts=10)
+        return batches, [paper.paper_id for paper in selected]
+
+    assert run(True) == ([["0"]], ["0", "1", "2", "3", "4"])
+    # Each failed upgrade leaves one open slot, so the scan falls back to one paper at a time.
+    assert run(False) == ([[str(index)] for index in [0, *range(5, 14)]], ["1", "2", "3", "4"])
+
+
+def test_search_results_and_canonical_records_are_cached_until_cleared():
+    from literature_retrieval_engine.providers.clients.crossref import CrossrefWork
+
+    class CountingOpenAlexClient(StubOpenAlexClient):
+        calls = 0
+
+        def search_works(self, *args, **kwargs):
+            CountingOpenAlexClient.calls += 1
+            return super().search_works(*args, **kwargs)
+
+        def get_work_by_doi(self, doi):
+            return None
+
+    class CountingCrossrefClient(StubCrossrefClient):
+        calls = 0
+
+        def works_by_doi(self, doi):
+            CountingCrossrefClient.calls += 1
+            return CrossrefWork(doi=doi, title="Crossref Title", year=None, authors=[], venue=None, url=None)
+
+    class MissingDataCiteClient:
+        def get_by_doi(self, doi):
+            return None
+
+    class MissingSemanticScholarClient(StubSemanticScholarClient):
+        def get_by_doi(self, doi, fields=None):
+            return None
+
+    service = PaperSearchService(
+        openalex=CountingOpenAlexClient([]),
+        semanticscholar=MissingSemanticScholarClient([]),
+        crossref=CountingCrossrefClient(),
+        datacite=MissingDataCiteClient(),
+        enable_openalex_no_stem_pass=False,
+    )
+
+    service.search("cached query", k=5)
+    service.search("cached query", k=5)
+    first = service._fetch_canonical_by_doi("10.1234/Example")
+    first.title = "Edited by caller"
+    first.authors.append("Edited Author")
+    second = service._fetch_canonical_by_doi("https://doi.org/10.1234/example")
+
+    assert CountingOpenAlexClient.calls == 1
+    assert CountingCrossrefClient.calls == 1
+    assert second.title == "Crossref Title"
+    assert second.authors == []
+
+    service.search("cached query", k=5, use_cache=False)
+
+    assert CountingOpenAlexClient.calls == 2
+
+    service.clear_cache()
+    service.search("cached query", k=5)
+
+    assert CountingOpenAlexClient.calls == 3
+
+    uncached = PaperSearchService(
+        openalex=CountingOpenAlexClient([]),
+        semanticscholar=MissingSemanticScholarClient([]),
+        crossref=CountingCrossrefClient(),
+        datacite=MissingDataCiteClient(),
+        enable_openalex_no_stem_pass=False,
+        search_cache_ttl=0,
+    )
+    uncached.search("cached query", k=5)
+    uncached.search("cached query", k=5)
+
+    assert CountingOpenAlexClient.calls == 5
+
+
+def test_canonical_lookup_skips_the_registry_that_cannot_hold_the_doi():
+    from literature_retrieval_engine.providers.clients.datacite import DataCiteWork
+
+    class UnexpectedCrossrefClient(StubCrossrefClient):
+        def works_by_doi(self, doi):
+            raise AssertionError("arXiv DOIs are registered with DataCite")
+
+    class DataCiteClient:
+        def get_by_doi(self, doi):
+            return DataCiteWork(doi=doi, title="arXiv Preprint", year=None, authors=[], venue=None, url=None)
+
+    class MissingOpenAlexClient(StubOpenAlexClient):
+        def get_work_by_doi(self, doi):
+            return None
+
+    class MissingSemanticScholarClient(StubSemanticScholarClient):
+        def get_by_doi(self, doi, fields=None):
+            return None
+
+    service = PaperSearchService(
+        openalex=MissingOpenAlexClient([]),
+        semanticscholar=MissingSemanticScholarClient([]),
+        crossref=UnexpectedCrossrefClient(),
+        datacite=DataCiteClient(),
+    )
+
+    paper = service._fetch_canonical_by_doi("10.48550/arXiv.2101.00001")
+
+    assert paper is not None
+    assert paper.source == "datacite"
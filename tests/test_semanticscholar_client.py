@@ -0,0 +1,41 @@
+import json
+
+import requests
+
+from literature_retrieval_engine.providers.clients import semanticscholar
+from literature_retrieval_engine.providers.clients.semanticscholar import SemanticScholarClient
+
+
+def test_get_by_dois_batches_ids_and_preserves_order(monkeypatch):
+    calls = []
+
+    def fake_request(self, method, path, **kwargs):  # type: ignore[override]
+        ids = kwargs["json"]["ids"]
+        calls.append((method, path, ids))
+
+        payload = [
+            None if doi_id.endswith("missing") else {"paperId": doi_id, "title": doi_id}
+            for doi_id in ids
+        ]
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(payload).encode()
+        return response
+
+    monkeypatch.setattr(SemanticScholarClient, "_request", fake_request)
+    monkeypatch.setattr(semanticscholar, "BATCH_SIZE", 2)
+
+    client = SemanticScholarClient()
+    papers = client.get_by_dois(["10.1/A", "", "10.1/missing", "https://doi.org/10.1/b"])
+
+    assert [(method, path) for method, path, _ in calls] == [
+        ("POST", "/paper/batch"),
+        ("POST", "/paper/batch"),
+    ]
+    assert [ids for _, _, ids in calls] == [["DOI:10.1/a", "DOI:10.1/missing"], ["DOI:10.1/b"]]
+    assert [paper.paper_id if paper else None for paper in papers] == [
+        "DOI:10.1/a",
+        None,
+        None,
+        "DOI:10.1/b",
+    ]
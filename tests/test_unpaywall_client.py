@@ -0,0 +1,42 @@
+from literature_retrieval_engine.providers.clients.unpaywall import UnpaywallClient
+
+
+def test_parse_record_dedupes_locations_and_prepends_missing_best():
+    client = UnpaywallClient("team@example.org")
+    repository = {"url": "https://repo.example/a", "url_for_pdf": None, "host_type": "repository"}
+
+    record = client._parse_record(
+        {
+            "doi": "10.1234/ABC",
+            "title": "Example",
+            "best_oa_location": {
+                "url": "https://publisher.example/a",
+                "url_for_pdf": "https://publisher.example/a.pdf",
+                "host_type": "publisher",
+                "is_best": True,
+            },
+            "oa_locations": [repository, dict(repository), "not-a-location"],
+        }
+    )
+
+    assert record.doi == "10.1234/abc"
+    assert [location.url for location in record.oa_locations] == [
+        "https://publisher.example/a",
+        "https://repo.example/a",
+    ]
+    assert record.best_pdf_url == "https://publisher.example/a.pdf"
+
+
+def test_parse_record_keeps_best_location_in_place_when_already_listed():
+    client = UnpaywallClient("team@example.org")
+    best = {"url": "https://repo.example/b", "url_for_pdf": "https://repo.example/b.pdf", "is_best": True}
+    other = {"url": "https://other.example/b", "url_for_pdf": None}
+
+    record = client._parse_record({"doi": "10.1234/b", "best_oa_location": best, "oa_locations": [other, best]})
+
+    assert [location.url for location in record.oa_locations] == [
+        "https://other.example/b",
+        "https://repo.example/b",
+    ]
+    assert record.best_oa_location is not None
+    assert record.best_oa_location.is_best is True